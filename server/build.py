@@ -5,32 +5,28 @@ import platform
 import shutil
 from pathlib import Path
 
+# Host platform, resolved once (platform.system() can shell out on some OSes)
+_ARCH_ALIASES = {
+    'x86_64': 'x86_64',
+    'amd64': 'x86_64',
+    'aarch64': 'aarch64',
+    'arm64': 'aarch64',
+    'i386': 'i686',
+    'i686': 'i686',
+    'x86': 'i686',
+}
+_SYSTEM = platform.system().lower()
+_ARCH = _ARCH_ALIASES.get(platform.machine().lower(), 'unknown')
+_TARGET_TRIPLES = {
+    'windows': f"{_ARCH}-pc-windows-msvc",
+    'darwin': f"{_ARCH}-apple-darwin",
+    'linux': f"{_ARCH}-unknown-linux-gnu",
+}
+_EXE_SUFFIX = ".exe" if _SYSTEM == "windows" else ""
+
 def get_tauri_binary_name(base_name: str) -> str:
     """Generate binary filename expected by Tauri based on platform"""
-    system = platform.system().lower()
-    arch = platform.machine().lower()
-    
-    # Normalize architecture name
-    if arch in ['x86_64', 'amd64']:
-        arch = 'x86_64'
-    elif arch in ['aarch64', 'arm64']:
-        arch = 'aarch64'
-    elif arch in ['i386', 'i686', 'x86']:
-        arch = 'i686'
-    else:
-        arch = 'unknown'
-    
-    if system == "windows":
-        return f"{base_name}-{arch}-pc-windows-msvc.exe"
-    elif system == "darwin":  # macOS
-        if arch == "x86_64":
-            return f"{base_name}-{arch}-apple-darwin"
-        else:  # aarch64
-            return f"{base_name}-{arch}-apple-darwin"
-    elif system == "linux":
-        return f"{base_name}-{arch}-unknown-linux-gnu"
-    else:
-        return f"{base_name}-{system}-{arch}"
+    return f"{base_name}-{get_target_triple()}{_EXE_SUFFIX}"
 
 def build_for_platform(base_name: str, target_triple: str, output_suffix: str):
     """Build executable for specific platform"""
@@ -81,27 +77,12 @@ def build_all_platforms():
     current_dir = Path(__file__).parent
     final_output_dir = current_dir / "../dist/server"
     
-    # Supported platform targets
-    platforms = [
-        # Windows
-        ("x86_64-pc-windows-msvc", ".exe"),
-        # macOS
-        ("x86_64-apple-darwin", ""),
-        ("aarch64-apple-darwin", ""),
-        # Linux
-        ("x86_64-unknown-linux-gnu", ""),
-        ("aarch64-unknown-linux-gnu", ""),
-    ]
-    
+    # PyInstaller cannot cross-compile: only the host target can be built here.
+    # Other targets are produced by running this script on each platform (CI matrix).
     built_files = []
-    
-    for target_triple, extension in platforms:
-        # In actual builds, you may need cross-compilation toolchain
-        # Here we only build for current platform
-        if should_build_for_target(target_triple):
-            output_file = build_for_platform(base_name, target_triple, extension)
-            if output_file:
-                built_files.append(output_file)
+    output_file = build_for_platform(base_name, get_target_triple(), _EXE_SUFFIX)
+    if output_file:
+        built_files.append(output_file)
     
     # Copy current platform file to root directory (for Tauri use)
     current_platform_file = copy_current_platform_binary(base_name, final_output_dir)
@@ -122,49 +103,26 @@ def build_all_platforms():
     
     return built_files
 
-def should_build_for_target(target_triple: str) -> bool:
-    """Check if should build for specified target"""
-    current_system = platform.system().lower()
-    current_arch = platform.machine().lower()
-    
-    # Simplified logic: only build for current platform
-    # In actual projects, you may need to set up cross-compilation environment
-    if "windows" in target_triple and current_system == "windows":
-        return True
-    elif "darwin" in target_triple and current_system == "darwin":
-        return True
-    elif "linux" in target_triple and current_system == "linux":
-        return True
-    
-    return False
-
 def copy_current_platform_binary(base_name: str, output_dir: Path) -> Path:
     """Copy current platform binary file to output directory"""
     current_platform_name = get_tauri_binary_name(base_name)
     current_dir = Path(__file__).parent
     
-    # Find current platform build file
-    dist_patterns = [
-        current_dir / "dist" / "**" / f"{base_name}*",
-        current_dir / "dist" / f"{base_name}*",
-        current_dir / "dist" / "**" / f"{base_name}.exe",
+    # Find current platform build file at the known output locations
+    # (build_for_platform output first, then raw PyInstaller output)
+    binary_name = f"{base_name}{_EXE_SUFFIX}"
+    dist_dir = current_dir / "dist"
+    candidates = [
+        dist_dir / get_target_triple() / binary_name,
+        dist_dir / binary_name,
     ]
-    
-    source_file = None
-    for pattern in dist_patterns:
-        for file_path in current_dir.glob(str(pattern.relative_to(current_dir))):
-            if file_path.is_file():
-                source_file = file_path
-                break
-        if source_file:
-            break
+    source_file = next((path for path in candidates if path.is_file()), None)
     
     if not source_file:
         # If not found, build for current platform
         print("Building for current platform...")
         target_name = get_target_triple()
-        source_file = build_for_platform(base_name, target_name, 
-                                       ".exe" if sys.platform == "win32" else "")
+        source_file = build_for_platform(base_name, target_name, _EXE_SUFFIX)
     
     if source_file and source_file.exists():
         # Ensure output directory exists
@@ -180,22 +138,7 @@ def copy_current_platform_binary(base_name: str, output_dir: Path) -> Path:
 
 def get_target_triple() -> str:
     """Get current platform target triple"""
-    system = platform.system().lower()
-    arch = platform.machine().lower()
-    
-    if arch in ['x86_64', 'amd64']:
-        arch = 'x86_64'
-    elif arch in ['aarch64', 'arm64']:
-        arch = 'aarch64'
-    
-    if system == "windows":
-        return f"{arch}-pc-windows-msvc"
-    elif system == "darwin":
-        return f"{arch}-apple-darwin"
-    elif system == "linux":
-        return f"{arch}-unknown-linux-gnu"
-    else:
-        return f"{arch}-unknown-{system}"
+    return _TARGET_TRIPLES.get(_SYSTEM, f"{_ARCH}-unknown-{_SYSTEM}")
 
 def main():
     """Main build function"""
@@ -222,9 +165,7 @@ def main():
     if args.current_platform_only:
         # Build only for current platform
         print("Building Flask API for current platform only...")
-        target_name = get_target_triple()
-        extension = ".exe" if sys.platform == "win32" else ""
-        built_file = build_for_platform("flask-api", target_name, extension)
+        built_file = build_for_platform("flask-api", get_target_triple(), _EXE_SUFFIX)
         
         if built_file:
             # Copy to resources directory for Tauri
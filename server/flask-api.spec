@@ -25,6 +25,8 @@ a = Analysis(
         'injector',
         # Request library
         'requests',
+        'orjson',
+        'msgpack',
         # SQLAlchemy related
         'sqlalchemy',
         'sqlalchemy.dialects.sqlite',
@@ -37,6 +39,10 @@ a = Analysis(
         'utils.exceptions',
         'utils.controller_helpers',
         'utils.stream_response',
+        'utils.json_provider',
+        'utils.http_session',
+        'utils.request_coalescer',
+        'utils.ttl_cache',
         'utils.system_prompt',
         'utils.prompt_template_loader',
         'utils.db_path',
@@ -61,10 +61,8 @@ if not os.getenv('DB_PATH'):
         print(f"Development mode: Using database at {local_db_path}")
 
 # Import and run the app
-import socket
-from werkzeug.serving import make_server
-from app import app, config, logger
-import app as app_module  # Import app module to set _server_instance
+from app import logger
+import app as app_module
 
 
 def _is_process_alive(pid: int) -> bool:
@@ -115,34 +113,4 @@ if __name__ == '__main__':
     if parent_pid_raw.isdigit():
         _start_parent_watchdog(int(parent_pid_raw))
 
-    requested_port = int(os.getenv('FLASK_PORT', '0'))
-    if requested_port == 0:
-        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        s.bind(('', 0))
-        requested_port = s.getsockname()[1]
-        s.close()
-    
-    server = make_server(config.HOST, requested_port, app)
-    actual_port = server.server_port
-    
-    # Store server instance in app module for shutdown API
-    app_module._server_instance = server
-    
-    print(f"FLASK_PORT:{actual_port}", flush=True)
-    
-    logger.info("Starting Flask server...")
-    logger.info(f"Environment: {config.__class__.__name__}")
-    logger.info(f"Host: {config.HOST}, Port: {actual_port}")
-    logger.info(f"Debug: {config.DEBUG}")
-    if os.getenv('DB_PATH'):
-        logger.info(f"Database path: {os.getenv('DB_PATH')}")
-    
-    try:
-        server.serve_forever()
-    except KeyboardInterrupt:
-        logger.info("=" * 60)
-        logger.info("Flask server received interrupt signal, shutting down...")
-        logger.info("=" * 60)
-        server.shutdown()
-        logger.info("Server shutdown completed")
-
+    app_module.serve()
@@ -6,7 +6,10 @@ Flask application entry point
 import sys
 import os
 import secrets
+import threading
+import time
 from pathlib import Path
+from typing import Callable, Set
 
 # Set UTF-8 encoding for stdout/stderr to support Chinese characters
 # This must be done before any imports that might use logging
@@ -25,11 +28,9 @@ if sys.platform == 'win32':
     # Set environment variable for subprocesses
     os.environ['PYTHONIOENCODING'] = 'utf-8'
 
-# Add server/src to Python path
-src_dir = Path(__file__).parent
-if str(src_dir) not in sys.path:
-    sys.path.insert(0, str(src_dir))
-server_dir = src_dir.parent
+# server/src is put on sys.path by the entry point (run.py, wsgi.py, the PyInstaller
+# pathex, or Python itself when this file is run as a script)
+server_dir = Path(__file__).resolve().parent.parent
 
 # Development mode: set DB_PATH if not set
 if not os.getenv('DB_PATH'):
@@ -55,18 +56,26 @@ from infrastructure.schema_migrations import apply_schema_migrations
 from repository.character_record_repository import apply_character_record_migrations
 from repository.conversation_repository import apply_conversation_settings_migrations
 from middleware.api_auth import register_api_auth
+from middleware.compression import register_compression
 from middleware.request_context import register_request_context
 from utils.db_path import get_database_path
 from utils.logger import setup_logger
+from utils.json_provider import OrjsonProvider
 from di.module import AppModule
 from controller.chat_controller import ChatController
 from controller.settings_controller import SettingsController
+from service.ai_service import AIService
 
 # Setup logger
 logger = setup_logger(__name__)
 
 # Create Flask app
 app = Flask(__name__)
+# jsonify() and dict returns serialize through orjson
+app.json = OrjsonProvider(app)
+# Responses are only read by the frontend: keep insertion order and never indent
+app.json.sort_keys = False
+app.json.compact = True
 
 # Load config
 config = get_config()
@@ -116,6 +125,10 @@ app.config['MAX_CONTENT_LENGTH'] = config.MAX_CONTENT_LENGTH
 
 register_api_auth(app)
 register_request_context(app)
+if config.COMPRESS_ENABLED:
+    app.config['COMPRESS_MIN_SIZE'] = config.COMPRESS_MIN_SIZE
+    app.config['COMPRESS_LEVEL'] = config.COMPRESS_LEVEL
+    register_compression(app)
 
 injector = FlaskInjector(app=app, modules=[AppModule()])
 
@@ -125,11 +138,7 @@ _server_instance = None
 
 @app.route('/')
 def index():
-    return {
-        "name": "OOC Flask API",
-        "version": "1.0.0",
-        "status": "running"
-    }
+    return jsonify({"name": "OOC Flask API", "version": "1.0.0", "status": "running"})
 
 
 # Register controller routes after dependency injection
@@ -140,15 +149,14 @@ with app.app_context():
     settings_controller = injector.injector.get(SettingsController)
     settings_controller.register_routes(app)
 
+    # Singleton; resolved once instead of walking the DI graph on every health poll
+    ai_service = injector.injector.get(AIService)
+
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
     try:
-        from service.ai_service import AIService
-        
         provider = request.args.get('provider', 'ollama')
-        
-        ai_service = injector.injector.get(AIService)
         result = ai_service.health_check(provider=provider)
         if isinstance(result, dict):
             result = dict(result)
@@ -166,9 +174,6 @@ def health_check():
 
 @app.route('/api/stop', methods=['POST'])
 def stop_server():
-    import threading
-    import time
-    
     logger.info("=" * 60)
     logger.info("Flask server received shutdown request...")
     logger.info("=" * 60)
@@ -187,12 +192,10 @@ def stop_server():
     
     if _server_instance:
         def shutdown():
-            # Give a small delay to ensure the response is sent first
-            time.sleep(0.1)
             try:
                 logger.info("Shutting down server via server.shutdown()")
-                # shutdown() will stop accepting new requests and wait for current requests to complete
-                # Since we're in a separate thread, this won't block the current request
+                # shutdown() only stops the accept loop; serve() then drains this request
+                # after server_close(), so the response is sent without a head-start sleep
                 _server_instance.shutdown()
                 logger.info("Server shutdown completed")
                 logger.info("=" * 60)
@@ -228,42 +231,104 @@ def stop_server():
 
 @app.errorhandler(404)
 def not_found(error):
-    return {
-        "success": False,
-        "error": "Endpoint not found"
-    }, 404
+    return jsonify({"success": False, "error": "Endpoint not found"}), 404
 
 
 @app.errorhandler(500)
 def internal_error(error):
     logger.error(f"Internal server error: {str(error)}", exc_info=True)
-    return {
-        "success": False,
-        "error": "Internal server error"
-    }, 500
+    return jsonify({"success": False, "error": "Internal server error"}), 500
 
 
-if __name__ == '__main__':
-    logger.info("Starting Flask server...")
-    logger.info(f"Environment: {config.__class__.__name__}")
-    logger.info(f"Host: {config.HOST}")
-    logger.info(f"Debug: {config.DEBUG}")
-    
+# How long shutdown waits for in-flight requests; open SSE streams can run far longer
+SHUTDOWN_DRAIN_TIMEOUT = 5.0
+
+
+def _track_handler_threads(server) -> Callable[[], Set[threading.Thread]]:
+    """
+    Record the live request-handler threads of a threaded werkzeug server
+
+    Returns:
+        Callable returning a snapshot of the handler threads still running
+    """
+    threads: Set[threading.Thread] = set()
+    lock = threading.Lock()
+    handle = server.process_request_thread
+
+    def tracked(request, client_address):
+        current = threading.current_thread()
+        with lock:
+            threads.add(current)
+        try:
+            handle(request, client_address)
+        finally:
+            with lock:
+                threads.discard(current)
+
+    def snapshot() -> Set[threading.Thread]:
+        with lock:
+            return set(threads)
+
+    server.process_request_thread = tracked
+    return snapshot
+
+
+def _drain_handler_threads(snapshot: Callable[[], Set[threading.Thread]], timeout: float) -> None:
+    """Join in-flight request threads until they finish or the deadline passes"""
+    deadline = time.monotonic() + timeout
+    for thread in snapshot():
+        thread.join(max(0.0, deadline - time.monotonic()))
+    remaining = len(snapshot())
+    if remaining:
+        logger.warning(
+            "%d request(s) still running after %.0fs; exiting without them",
+            remaining, timeout,
+        )
+
+
+def serve() -> None:
+    """
+    Serve the app with werkzeug's threaded server until /api/stop or Ctrl+C
+
+    Shared by run.py and ``python src/app.py`` so both get the same port
+    handshake, shutdown handle and request draining.
+    """
+    global _server_instance
     from werkzeug.serving import make_server
-    import socket
+
+    # Port 0 lets make_server bind an ephemeral port itself; server_port reports it
     requested_port = int(os.getenv('FLASK_PORT', '0'))
-    if requested_port == 0:
-        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        s.bind(('', 0))
-        requested_port = s.getsockname()[1]
-        s.close()
-    
-    _server_instance = make_server(config.HOST, requested_port, app)
-    actual_port = _server_instance.server_port
-    
+    server = make_server(config.HOST, requested_port, app, threaded=config.THREADED)
+    # Handler threads are daemons so a stream still open at the drain deadline cannot keep
+    # the process alive; they are tracked here and joined with a bound instead of by server_close()
+    server.daemon_threads = True
+    handler_threads = _track_handler_threads(server)
+    actual_port = server.server_port
+
+    # Store server instance for the shutdown API
+    _server_instance = server
+
     print(f"FLASK_PORT:{actual_port}", flush=True)
-    
-    logger.info(f"Server running on http://{config.HOST}:{actual_port}")
-    
-    _server_instance.serve_forever()
 
+    logger.info("Starting Flask server...")
+    logger.info(f"Environment: {config.__name__}")
+    logger.info(f"Host: {config.HOST}, Port: {actual_port}")
+    logger.info(f"Debug: {config.DEBUG}, Threaded: {config.THREADED}")
+    if os.getenv('DB_PATH'):
+        logger.info(f"Database path: {os.getenv('DB_PATH')}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("=" * 60)
+        logger.info("Flask server received interrupt signal, shutting down...")
+        logger.info("=" * 60)
+    finally:
+        server.server_close()
+        # Lets in-flight requests (including the /api/stop response) finish, up to the deadline
+        _drain_handler_threads(handler_threads, SHUTDOWN_DRAIN_TIMEOUT)
+        logger.info("Server closed")
+
+
+if __name__ == '__main__':
+    serve()
@@ -4,6 +4,7 @@
 Application configuration module
 """
 import os
+from functools import lru_cache
 from typing import FrozenSet, Optional, Tuple
 
 
@@ -11,12 +12,20 @@ def _parse_csv(value: str) -> Tuple[str, ...]:
     return tuple(x.strip() for x in value.split(',') if x.strip())
 
 
+def _env_flag(name: str, default: str) -> bool:
+    """Read a boolean env var once at class creation ('1', 'true' and 'yes' enable it)"""
+    return os.getenv(name, default).strip().lower() in ('1', 'true', 'yes')
+
+
 class Config:
     """Base configuration class"""
     # Flask configuration
     HOST: str = os.getenv('FLASK_HOST', '127.0.0.1')
     PORT: int = int(os.getenv('FLASK_PORT', '5000'))
     DEBUG: bool = os.getenv('FLASK_DEBUG', 'False').lower() == 'true'
+    # Serve each request on its own thread so a long LLM call does not block
+    # health checks, streams or other chats (werkzeug make_server defaults to False)
+    THREADED: bool = _env_flag('FLASK_THREADED', 'true')
     
     # CORS configuration (origins empty + CORS_ENABLED True => no cross-origin in practice)
     CORS_ENABLED: bool = os.getenv('CORS_ENABLED', 'true').lower() == 'true'
@@ -75,7 +84,28 @@ class Config:
     KIMI_BASE_URL: str = os.getenv('KIMI_BASE_URL', 'https://api.moonshot.cn')
     MINIMAX_BASE_URL: str = os.getenv('MINIMAX_BASE_URL', 'https://api.minimax.chat')
     ANTHROPIC_TIMEOUT: int = int(os.getenv('ANTHROPIC_TIMEOUT', '60'))
-    
+
+    # Keep-alive pool size per provider host (legacy requests-based clients)
+    HTTP_POOL_MAXSIZE: int = int(os.getenv('HTTP_POOL_MAXSIZE', '16'))
+
+    # Exact-match cache for deterministic (temperature 0) chat calls; TTL 0 disables it
+    CHAT_RESPONSE_CACHE_TTL: int = int(os.getenv('CHAT_RESPONSE_CACHE_TTL', '3600'))
+    CHAT_RESPONSE_CACHE_MAXSIZE: int = int(os.getenv('CHAT_RESPONSE_CACHE_MAXSIZE', '1024'))
+
+    # Seconds to reuse the Ollama model list before asking /api/tags again; 0 disables
+    MODELS_CACHE_TTL: int = int(os.getenv('MODELS_CACHE_TTL', '300'))
+
+    # Seconds to reuse the last Ollama health probe result; 0 disables
+    HEALTH_CACHE_TTL: float = float(os.getenv('HEALTH_CACHE_TTL', '2'))
+
+    # Seconds to reuse a provider's stored AI config for chat calls; saves clear it, 0 disables
+    AI_CONFIG_CACHE_TTL: float = float(os.getenv('AI_CONFIG_CACHE_TTL', '60'))
+
+    # Gzip JSON responses for non-loopback clients (the local Tauri client is never compressed)
+    COMPRESS_ENABLED: bool = _env_flag('COMPRESS_ENABLED', 'true')
+    COMPRESS_MIN_SIZE: int = int(os.getenv('COMPRESS_MIN_SIZE', '1024'))
+    COMPRESS_LEVEL: int = int(os.getenv('COMPRESS_LEVEL', '4'))
+
     # Logging configuration
     LOG_LEVEL: str = os.getenv('LOG_LEVEL', 'INFO')
     LOG_FORMAT: str = (
@@ -105,17 +135,10 @@ class Config:
     # Token estimation configuration (for more precise control)
     ESTIMATED_TOKENS_PER_MESSAGE: int = int(os.getenv('ESTIMATED_TOKENS_PER_MESSAGE', '500'))  # Estimated tokens per message
     MAX_CONTEXT_TOKENS: int = int(os.getenv('MAX_CONTEXT_TOKENS', '60000'))  # Max context tokens (default 60K, suitable for most models)
-    CONTEXT_MANAGEMENT_ENABLED: bool = os.getenv(
-        'CONTEXT_MANAGEMENT_ENABLED',
-        'true',
-    ).lower() in ('1', 'true', 'yes')
+    CONTEXT_MANAGEMENT_ENABLED: bool = _env_flag('CONTEXT_MANAGEMENT_ENABLED', 'true')
 
     # LangChain: unified chat invoke/stream (set false to use legacy Ollama generate + DeepSeek requests)
-    USE_LANGCHAIN: bool = os.getenv('USE_LANGCHAIN', 'true').lower() in (
-        '1',
-        'true',
-        'yes',
-    )
+    USE_LANGCHAIN: bool = _env_flag('USE_LANGCHAIN', 'true')
 
 
 class DevelopmentConfig(Config):
@@ -150,7 +173,7 @@ class TestingConfig(Config):
     DEBUG: bool = True
     LOG_LEVEL: str = 'DEBUG'
     # Unit tests mock legacy services; LangChain path would require LC mocks or network.
-    USE_LANGCHAIN: bool = os.getenv('USE_LANGCHAIN', 'false').lower() in ('1', 'true', 'yes')
+    USE_LANGCHAIN: bool = _env_flag('USE_LANGCHAIN', 'false')
     _test_cors = os.getenv('CORS_ORIGINS', '').strip()
     CORS_ORIGINS: Tuple[str, ...] = (
         _parse_csv(_test_cors) if _test_cors else ('http://127.0.0.1', 'http://localhost')
@@ -166,9 +189,13 @@ config = {
 }
 
 
+@lru_cache(maxsize=8)
 def get_config(env: Optional[str] = None) -> Config:
     """
     Get configuration object
+
+    Memoized: FLASK_ENV is read on the first call only (it is fixed at process
+    start); use ``get_config.cache_clear()`` if it has to be re-read.
     
     Args:
         env: Environment name (development, production, testing)
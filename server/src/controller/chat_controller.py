@@ -6,8 +6,8 @@ import uuid
 import base64
 import hashlib
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
-from flask import Flask, request, jsonify
+from typing import Dict, List, Optional, Tuple
+from flask import Flask, Response, request, jsonify
 from injector import inject
 from service.chat_orchestration_service import ChatOrchestrationService
 from service.summary_service import SummaryService
@@ -22,20 +22,24 @@ from service.app_settings_service import AppSettingsService
 from service.conversation_service import ConversationService
 from service.story_service import StoryService
 from service.attachment_storage_service import AttachmentStorageService
+from middleware.request_context import MAX_CONVERSATION_ID_LEN
 from infrastructure.provider_capabilities import (
     get_provider_capability,
     apply_provider_multimodal_policy,
 )
 from utils.logger import get_logger
-from utils.exceptions import APIError, ValidationError, ProviderError
+from utils.exceptions import APIError, ProviderError
 from utils.stream_response import create_stream_response
 from utils.i18n import get_i18n_text
-from utils.controller_helpers import error_response, handle_errors
+from utils.controller_helpers import error_response, handle_errors, validate_required_fields, request_json
 from utils.think_strip import strip_think_content
 from utils.db_path import get_story_library_dir
 
 logger = get_logger(__name__)
 
+# Database errors can stringify to multi-KB statement dumps; clients get the head only
+_MAX_ERROR_DETAIL_LEN = 512
+
 
 def _escape_pdf_text(value: str) -> str:
     return value.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
@@ -83,6 +87,40 @@ def _build_simple_pdf(lines: List[str]) -> bytes:
 def _canonical_json(value: Dict) -> str:
     return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
 
+
+# (rule, HTTP method, controller method); each method is also the endpoint name
+_ROUTES = (
+    ('/api/chat', 'POST', 'chat'),
+    ('/api/chat-stream', 'POST', 'chat_stream'),
+    ('/api/models', 'GET', 'get_models'),
+    ('/api/conversations', 'GET', 'get_all_conversations'),
+    ('/api/conversation', 'GET', 'get_conversation'),
+    ('/api/conversation', 'DELETE', 'delete_conversation'),
+    ('/api/conversation/summary', 'GET', 'get_summary'),
+    ('/api/conversation/summary/generate', 'POST', 'generate_summary'),
+    ('/api/conversation/summary', 'POST', 'save_summary'),
+    ('/api/story/generate', 'POST', 'generate_story_section'),
+    ('/api/story/generate-stream', 'POST', 'generate_story_section_stream'),
+    ('/api/story/confirm', 'POST', 'confirm_section'),
+    ('/api/story/rewrite', 'POST', 'rewrite_section'),
+    ('/api/story/modify', 'POST', 'modify_section'),
+    ('/api/story/user-note', 'POST', 'save_user_note'),
+    ('/api/conversation/delete-last-message', 'POST', 'delete_last_message'),
+    ('/api/conversation/assistant-variants', 'GET', 'get_assistant_variants'),
+    ('/api/conversation/assistant-variants/restore', 'POST', 'restore_assistant_variant'),
+    ('/api/story/branches', 'GET', 'list_story_branches'),
+    ('/api/story/branches', 'POST', 'create_story_branch'),
+    ('/api/story/savepoint', 'POST', 'create_story_savepoint'),
+    ('/api/story/savepoint', 'GET', 'list_story_savepoints'),
+    ('/api/story/savepoint/restore', 'POST', 'restore_story_savepoint'),
+    ('/api/story/ending', 'POST', 'mark_story_ending'),
+    ('/api/story/ending', 'GET', 'list_story_endings'),
+    ('/api/export/pdf', 'POST', 'export_story_pdf'),
+    ('/api/export/project-bundle', 'POST', 'export_project_bundle'),
+    ('/api/import/project-bundle/validate', 'POST', 'validate_project_bundle'),
+)
+
+
 class ChatController:
     """Chat controller"""
     
@@ -141,118 +179,9 @@ class ChatController:
         Args:
             app: Flask app instance
         """
-        @app.route('/api/chat', methods=['POST'])
-        def chat():
-            return self.chat()
-        
-        @app.route('/api/chat-stream', methods=['POST'])
-        def chat_stream():
-            return self.chat_stream()
-        
-        @app.route('/api/models', methods=['GET'])
-        def get_models():
-            return self.get_models()
-        
-        @app.route('/api/conversations', methods=['GET'])
-        def get_all_conversations():
-            return self.get_all_conversations()
-        
-        @app.route('/api/conversation', methods=['GET'])
-        def get_conversation():
-            return self.get_conversation()
-        
-        @app.route('/api/conversation', methods=['DELETE'])
-        def delete_conversation():
-            return self.delete_conversation()
-        
-        @app.route('/api/conversation/summary', methods=['GET'])
-        def get_summary():
-            return self.get_summary()
-        
-        @app.route('/api/conversation/summary/generate', methods=['POST'])
-        def generate_summary():
-            return self.generate_summary()
-        
-        @app.route('/api/conversation/summary', methods=['POST'])
-        def save_summary():
-            return self.save_summary()
-        
-        @app.route('/api/story/generate', methods=['POST'])
-        def generate_story_section():
-            return self.generate_story_section()
-        
-        @app.route('/api/story/generate-stream', methods=['POST'])
-        def generate_story_section_stream():
-            return self.generate_story_section_stream()
-        
-        @app.route('/api/story/confirm', methods=['POST'])
-        def confirm_section():
-            return self.confirm_section()
-        
-        @app.route('/api/story/rewrite', methods=['POST'])
-        def rewrite_section():
-            return self.rewrite_section()
-        
-        @app.route('/api/story/modify', methods=['POST'])
-        def modify_section():
-            return self.modify_section()
-
-        @app.route('/api/story/user-note', methods=['POST'])
-        def save_user_note():
-            return self.save_user_note()
-        
-        @app.route('/api/conversation/delete-last-message', methods=['POST'])
-        def delete_last_message():
-            return self.delete_last_message()
-
-        @app.route('/api/conversation/assistant-variants', methods=['GET'])
-        def get_assistant_variants():
-            return self.get_assistant_variants()
-
-        @app.route('/api/conversation/assistant-variants/restore', methods=['POST'])
-        def restore_assistant_variant():
-            return self.restore_assistant_variant()
-
-        @app.route('/api/story/branches', methods=['GET'])
-        def list_story_branches():
-            return self.list_story_branches()
-
-        @app.route('/api/story/branches', methods=['POST'])
-        def create_story_branch():
-            return self.create_story_branch()
+        for rule, method, name in _ROUTES:
+            app.add_url_rule(rule, endpoint=name, view_func=getattr(self, name), methods=[method])
 
-        @app.route('/api/story/savepoint', methods=['POST'])
-        def create_story_savepoint():
-            return self.create_story_savepoint()
-
-        @app.route('/api/story/savepoint', methods=['GET'])
-        def list_story_savepoints():
-            return self.list_story_savepoints()
-
-        @app.route('/api/story/savepoint/restore', methods=['POST'])
-        def restore_story_savepoint():
-            return self.restore_story_savepoint()
-
-        @app.route('/api/story/ending', methods=['POST'])
-        def mark_story_ending():
-            return self.mark_story_ending()
-
-        @app.route('/api/story/ending', methods=['GET'])
-        def list_story_endings():
-            return self.list_story_endings()
-
-        @app.route('/api/export/pdf', methods=['POST'])
-        def export_story_pdf():
-            return self.export_story_pdf()
-
-        @app.route('/api/export/project-bundle', methods=['POST'])
-        def export_project_bundle():
-            return self.export_project_bundle()
-
-        @app.route('/api/import/project-bundle/validate', methods=['POST'])
-        def validate_project_bundle():
-            return self.validate_project_bundle()
-    
     @handle_errors
     def chat(self):
         """
@@ -290,19 +219,11 @@ class ChatController:
             )
         
         language = self.app_settings_service.get_language()
-        if not normalized_message:
-            error_msg = get_i18n_text(language, 'error_messages.message_required')
-            return jsonify({
-                "success": False,
-                "error": error_msg
-            }), 400
-        
-        if not provider:
-            error_msg = get_i18n_text(language, 'error_messages.provider_required')
-            return jsonify({
-                "success": False,
-                "error": error_msg
-            }), 400
+        error = validate_required_fields(
+            language, {'message': normalized_message, 'provider': provider}
+        )
+        if error:
+            return error
         
         result = self.chat_orchestration_service.process_chat(
             message=normalized_message,
@@ -319,10 +240,12 @@ class ChatController:
         
         return jsonify(result)
     
-    def _strip_think_content(self, text: str) -> str:
+    @staticmethod
+    def _strip_think_content(text: str) -> str:
         """Remove think content from AI response (delegates to shared util)."""
         return strip_think_content(text)
     
+    @handle_errors
     def chat_stream(self):
         """
         Streaming chat endpoint
@@ -336,133 +259,96 @@ class ChatController:
         Returns:
             SSE stream with chunks of AI response
         """
-        try:
-            payload = self._parse_chat_payload()
-            data = payload['data']
-            message = payload['message']
-            provider = payload['provider']
-            normalized = apply_provider_multimodal_policy(
-                provider=provider,
-                message=message,
-                message_parts=payload['message_parts'],
-            )
-            normalized_message = normalized.normalized_message
-            content_type = normalized.content_type
-            attachment_ref = normalized.attachment_ref
-            conversation_id = payload['conversation_id']
-            
-            language = self.app_settings_service.get_language()
-            if not normalized_message:
-                error_msg = get_i18n_text(language, 'error_messages.message_required')
-                return jsonify({
-                    "success": False,
-                    "error": error_msg
-                }), 400
-            
-            if not provider:
-                error_msg = get_i18n_text(language, 'error_messages.provider_required')
-                return jsonify({
-                    "success": False,
-                    "error": error_msg
-                }), 400
-            
-            api_config = self.ai_config_service.get_config_for_api(
-                provider=provider,
-                model=data.get('model')
-            )
-            settings = (
-                self.conversation_service.get_settings(conversation_id)
-                if conversation_id
-                else None
-            )
-            api_config = ChatOrchestrationService._merge_conversation_llm_overrides(
-                api_config,
-                settings,
+        payload = self._parse_chat_payload()
+        data = payload['data']
+        message = payload['message']
+        provider = payload['provider']
+        normalized = apply_provider_multimodal_policy(
+            provider=provider,
+            message=message,
+            message_parts=payload['message_parts'],
+        )
+        normalized_message = normalized.normalized_message
+        content_type = normalized.content_type
+        attachment_ref = normalized.attachment_ref
+        conversation_id = payload['conversation_id']
+        is_new_conversation = payload['new_conversation']
+        
+        language = self.app_settings_service.get_language()
+        error = validate_required_fields(
+            language, {'message': normalized_message, 'provider': provider}
+        )
+        if error:
+            return error
+        
+        api_config = self.ai_config_service.get_config_for_api(
+            provider=provider,
+            model=data.get('model')
+        )
+        settings = (
+            self.conversation_service.get_settings(conversation_id)
+            if not is_new_conversation
+            else None
+        )
+        api_config = ChatOrchestrationService._merge_conversation_llm_overrides(
+            api_config,
+            settings,
+        )
+        
+        # Get conversation history for context
+        messages = []
+        if not is_new_conversation:
+            messages = self.chat_service.get_recent_messages_for_api(conversation_id, limit=10)
+        
+        # Create stream generator
+        def stream_generator():
+            if normalized.provider_capability_notice:
+                yield json.dumps({
+                    "provider_capability_notice": normalized.provider_capability_notice
+                }, ensure_ascii=False)
+            yield from self.ai_service_streaming.chat_stream(
+                provider=api_config['provider'],
+                message=normalized_message,
+                model=api_config['model'],
+                api_key=api_config['api_key'],
+                base_url=api_config['base_url'],
+                max_tokens=api_config['max_tokens'],
+                temperature=api_config['temperature'],
+                messages=messages if messages else None,
+                stop_words=api_config.get('stop_words'),
+                message_parts=normalized.normalized_parts,
             )
-            
-            # Get conversation history for context
-            messages = []
-            if conversation_id:
-                history = self.chat_service.get_conversation(conversation_id, limit=10)
-                messages = [
-                    {
-                        "role": msg['role'],
-                        "content": msg['content'],
-                        "parts": msg.get('parts'),
-                    }
-                    for msg in history
-                ]
-            
-            # Create stream generator
-            def stream_generator():
-                if normalized.provider_capability_notice:
-                    yield json.dumps({
-                        "provider_capability_notice": normalized.provider_capability_notice
-                    }, ensure_ascii=False)
-                yield from self.ai_service_streaming.chat_stream(
-                    provider=api_config['provider'],
+        
+        persist_metadata: dict = {}
+
+        def on_complete(accumulated_content: str):
+            final_content = self._strip_think_content(accumulated_content)
+            try:
+                # One commit for the user row, attachment links and the reply
+                self.chat_orchestration_service.save_chat_turn(
+                    conversation_id=conversation_id,
                     message=normalized_message,
+                    reply=final_content,
                     model=api_config['model'],
-                    api_key=api_config['api_key'],
-                    base_url=api_config['base_url'],
-                    max_tokens=api_config['max_tokens'],
-                    temperature=api_config['temperature'],
-                    messages=messages if messages else None,
-                    stop_words=api_config.get('stop_words'),
-                    message_parts=normalized.normalized_parts,
+                    provider=api_config['provider'],
+                    content_type=content_type,
+                    attachment_ref=attachment_ref,
+                )
+            except Exception:
+                logger.error(
+                    "Failed to persist streamed chat messages",
+                    exc_info=True,
+                )
+                persist_metadata['persist_failed'] = get_i18n_text(
+                    language,
+                    'error_messages.persist_chat_messages_failed',
                 )
-            
-            persist_metadata: dict = {}
-
-            def on_complete(accumulated_content: str):
-                final_content = self._strip_think_content(accumulated_content)
-                try:
-                    user_message = self.chat_service.save_user_message(
-                        conversation_id=conversation_id,
-                        message=normalized_message,
-                        content_type=content_type,
-                        attachment_ref=attachment_ref,
-                    )
-                    self._attach_refs_to_message(attachment_ref, conversation_id, user_message)
-                    self.chat_service.save_assistant_message(
-                        conversation_id=conversation_id,
-                        content=final_content,
-                        model=api_config['model'],
-                        provider=api_config['provider'],
-                        content_type=content_type,
-                        attachment_ref=attachment_ref,
-                    )
-                except Exception:
-                    logger.error(
-                        "Failed to persist streamed chat messages",
-                        exc_info=True,
-                    )
-                    persist_metadata['persist_failed'] = get_i18n_text(
-                        language,
-                        'error_messages.persist_chat_messages_failed',
-                    )
 
-            return create_stream_response(
-                stream_generator=stream_generator(),
-                on_complete=on_complete,
-                persist_metadata=persist_metadata,
-            )
-        
-        except ValidationError as e:
-            logger.warning(f"Validation error: {e.message}")
-            return jsonify(e.to_dict()), e.status_code
-        
-        except ProviderError as e:
-            logger.error(f"Provider error ({e.provider}): {e.message}")
-            return jsonify(e.to_dict()), e.status_code
-        
-        except Exception as e:
-            logger.error(f"Unexpected error in chat_stream endpoint: {str(e)}", exc_info=True)
-            error = APIError(
-                f"Server error: {str(e)}",
-                status_code=500
-            )
-            return jsonify(error.to_dict()), 500
+        return create_stream_response(
+            stream_generator=stream_generator(),
+            on_complete=on_complete,
+            persist_metadata=persist_metadata,
+        )
 
     def _parse_chat_payload(self) -> Dict:
         content_type = (request.content_type or '').lower()
@@ -481,12 +367,13 @@ class ChatController:
                     message_parts = []
             uploads = request.files.getlist('files')
         else:
-            data = request.json or {}
+            data = request_json()
             raw_parts = data.get('message_parts')
             if isinstance(raw_parts, list):
                 message_parts = [item for item in raw_parts if isinstance(item, dict)]
 
-        conversation_id = str(data.get('conversation_id') or '').strip() or str(uuid.uuid4())
+        requested_id = str(data.get('conversation_id') or '').strip()
+        conversation_id = requested_id or str(uuid.uuid4())
         provider = str(data.get('provider') or '').strip()
         message = str(data.get('message') or '').strip()
 
@@ -513,44 +400,14 @@ class ChatController:
             'message': message,
             'provider': provider,
             'conversation_id': conversation_id,
+            # A generated id has no stored settings or history to look up
+            'new_conversation': not requested_id,
             'message_parts': message_parts,
         }
 
-    def _attach_refs_to_message(
-        self,
-        attachment_ref: Optional[str],
-        conversation_id: str,
-        user_message: Dict,
-    ) -> None:
-        if not attachment_ref:
-            return
-        try:
-            payload = json.loads(attachment_ref)
-        except Exception:
-            return
-        if not isinstance(payload, list):
-            return
-        refs: List[str] = []
-        for item in payload:
-            if not isinstance(item, dict):
-                continue
-            asset_ref = str(item.get('asset_ref') or '').strip()
-            if asset_ref:
-                refs.append(asset_ref)
-        if not refs:
-            return
-        message_id = user_message.get('id')
-        if message_id is None:
-            return
-        self.attachment_storage_service.attach_to_message(
-            asset_refs=refs,
-            message_id=int(message_id),
-            conversation_id=conversation_id,
-        )
-
     @handle_errors
     def create_story_branch(self):
-        data = request.json or {}
+        data = request_json()
         conversation_id = data.get('conversation_id')
         language = self.app_settings_service.get_language()
         if not conversation_id:
@@ -574,7 +431,7 @@ class ChatController:
 
     @handle_errors
     def create_story_savepoint(self):
-        data = request.json or {}
+        data = request_json()
         conversation_id = data.get('conversation_id')
         language = self.app_settings_service.get_language()
         if not conversation_id:
@@ -598,7 +455,7 @@ class ChatController:
 
     @handle_errors
     def restore_story_savepoint(self):
-        data = request.json or {}
+        data = request_json()
         conversation_id = data.get('conversation_id')
         savepoint_id = data.get('savepoint_id')
         language = self.app_settings_service.get_language()
@@ -622,7 +479,7 @@ class ChatController:
 
     @handle_errors
     def mark_story_ending(self):
-        data = request.json or {}
+        data = request_json()
         conversation_id = data.get('conversation_id')
         ending_tag = data.get('ending_tag')
         language = self.app_settings_service.get_language()
@@ -649,7 +506,7 @@ class ChatController:
 
     @handle_errors
     def export_story_pdf(self):
-        data = request.json or {}
+        data = request_json()
         conversation_id = data.get('conversation_id')
         title = (data.get('title') or 'Story Export').strip()
         language = self.app_settings_service.get_language()
@@ -690,7 +547,7 @@ class ChatController:
 
     @handle_errors
     def export_project_bundle(self):
-        data = request.json or {}
+        data = request_json()
         conversation_id = data.get('conversation_id')
         language = self.app_settings_service.get_language()
         if not conversation_id:
@@ -722,7 +579,7 @@ class ChatController:
 
     @handle_errors
     def validate_project_bundle(self):
-        data = request.json or {}
+        data = request_json()
         bundle = data.get("bundle")
         if not isinstance(bundle, dict):
             return jsonify(
@@ -757,6 +614,22 @@ class ChatController:
             ), 400
         return jsonify({"success": True, "valid": True})
     
+    def _story_payload(self, *required: str) -> Tuple[Dict, Optional[Response]]:
+        """
+        Read a story request body and check required fields in order
+        
+        Returns:
+            The body and, if a field is missing, the error response to return
+        """
+        data = request_json()
+        if all(data.get(field) for field in required):
+            return data, None
+        language = self.app_settings_service.get_language()
+        return data, validate_required_fields(
+            language, {field: data.get(field) for field in required}
+        )
+    
+    @handle_errors
     def generate_story_section(self):
         """
         Generate story section
@@ -766,33 +639,18 @@ class ChatController:
             - provider: AI provider (ollama or deepseek)
             - model: Model name (uses default from global config if not provided)
         """
-        try:
-            data = request.json or {}
-            conversation_id = data.get('conversation_id')
-            provider = data.get('provider')
-            
-            language = self.app_settings_service.get_language()
-            if not conversation_id:
-                return error_response(language, 'error_messages.conversation_id_required')
-            
-            if not provider:
-                return error_response(language, 'error_messages.provider_required')
-            
-            result = self.story_generation_service.generate_story_section(
-                conversation_id=conversation_id,
-                provider=provider,
-                model=data.get('model')
-            )
-            
-            return jsonify(result)
+        data, error = self._story_payload('conversation_id', 'provider')
+        if error:
+            return error
         
-        except Exception as e:
-            logger.error(f"Error in generate_story_section: {str(e)}", exc_info=True)
-            return jsonify({
-                "success": False,
-                "error": f"Server error: {str(e)}"
-            }), 500
+        result = self.story_generation_service.generate_story_section(
+            conversation_id=data['conversation_id'],
+            provider=data['provider'],
+            model=data.get('model')
+        )
+        return jsonify(result)
     
+    @handle_errors
     def generate_story_section_stream(self):
         """
         Generate story section with streaming
@@ -805,44 +663,19 @@ class ChatController:
         Returns:
             SSE stream with chunks of story content
         """
-        try:
-            data = request.json or {}
-            conversation_id = data.get('conversation_id')
-            provider = data.get('provider')
-            
-            language = self.app_settings_service.get_language()
-            if not conversation_id:
-                return error_response(language, 'error_messages.conversation_id_required')
-            
-            if not provider:
-                return error_response(language, 'error_messages.provider_required')
-            
-            # Create stream generator
-            def stream_generator():
-                return self.story_generation_service.generate_story_section_stream(
-                    conversation_id=conversation_id,
-                    provider=provider,
-                    model=data.get('model')
-                )
-            
-            return create_stream_response(stream_generator=stream_generator())
-        
-        except ValidationError as e:
-            logger.warning(f"Validation error: {e.message}")
-            return jsonify(e.to_dict()), e.status_code
-        
-        except ProviderError as e:
-            logger.error(f"Provider error ({e.provider}): {e.message}")
-            return jsonify(e.to_dict()), e.status_code
-        
-        except Exception as e:
-            logger.error(f"Unexpected error in generate_story_section_stream endpoint: {str(e)}", exc_info=True)
-            error = APIError(
-                f"Server error: {str(e)}",
-                status_code=500
+        data, error = self._story_payload('conversation_id', 'provider')
+        if error:
+            return error
+        
+        return create_stream_response(
+            stream_generator=self.story_generation_service.generate_story_section_stream(
+                conversation_id=data['conversation_id'],
+                provider=data['provider'],
+                model=data.get('model')
             )
-            return jsonify(error.to_dict()), 500
+        )
     
+    @handle_errors
     def confirm_section(self):
         """
         Confirm current section, generate next section
@@ -852,33 +685,18 @@ class ChatController:
             - provider: AI provider (ollama or deepseek)
             - model: Model name (uses default from global config if not provided)
         """
-        try:
-            data = request.json or {}
-            conversation_id = data.get('conversation_id')
-            provider = data.get('provider')
-            
-            language = self.app_settings_service.get_language()
-            if not conversation_id:
-                return error_response(language, 'error_messages.conversation_id_required')
-            
-            if not provider:
-                return error_response(language, 'error_messages.provider_required')
-            
-            result = self.story_generation_service.confirm_section(
-                conversation_id=conversation_id,
-                provider=provider,
-                model=data.get('model')
-            )
-            
-            return jsonify(result)
+        data, error = self._story_payload('conversation_id', 'provider')
+        if error:
+            return error
         
-        except Exception as e:
-            logger.error(f"Error in confirm_section: {str(e)}", exc_info=True)
-            return jsonify({
-                "success": False,
-                "error": f"Server error: {str(e)}"
-            }), 500
+        result = self.story_generation_service.confirm_section(
+            conversation_id=data['conversation_id'],
+            provider=data['provider'],
+            model=data.get('model')
+        )
+        return jsonify(result)
     
+    @handle_errors
     def rewrite_section(self):
         """
         Rewrite current section
@@ -889,43 +707,24 @@ class ChatController:
             - provider: AI provider (ollama or deepseek)
             - model: Model name
         """
-        try:
-            data = request.json or {}
-            conversation_id = data.get('conversation_id')
-            feedback = data.get('feedback', '')
-            provider = data.get('provider')
-            language = self.app_settings_service.get_language()
-            
-            if not conversation_id:
-                return error_response(language, 'error_messages.conversation_id_required')
-            
-            if not feedback:
-                return error_response(language, 'error_messages.feedback_required')
-            
-            if not provider:
-                return error_response(language, 'error_messages.provider_required')
-            
-            raw_op = data.get('feedback_operation')
-            feedback_operation = (
-                raw_op if raw_op in ('rewrite', 'modify') else None
-            )
-            result = self.story_generation_service.rewrite_section(
-                conversation_id=conversation_id,
-                feedback=feedback,
-                provider=provider,
-                model=data.get('model'),
-                feedback_operation=feedback_operation,
-            )
-            
-            return jsonify(result)
+        data, error = self._story_payload('conversation_id', 'feedback', 'provider')
+        if error:
+            return error
         
-        except Exception as e:
-            logger.error(f"Error in rewrite_section: {str(e)}", exc_info=True)
-            return jsonify({
-                "success": False,
-                "error": f"Server error: {str(e)}"
-            }), 500
+        raw_op = data.get('feedback_operation')
+        feedback_operation = (
+            raw_op if raw_op in ('rewrite', 'modify') else None
+        )
+        result = self.story_generation_service.rewrite_section(
+            conversation_id=data['conversation_id'],
+            feedback=data['feedback'],
+            provider=data['provider'],
+            model=data.get('model'),
+            feedback_operation=feedback_operation,
+        )
+        return jsonify(result)
     
+    @handle_errors
     def modify_section(self):
         """
         Modify current section
@@ -936,41 +735,21 @@ class ChatController:
             - provider: AI provider (ollama or deepseek)
             - model: Model name
         """
-        try:
-            data = request.json or {}
-            conversation_id = data.get('conversation_id')
-            feedback = data.get('feedback', '')
-            provider = data.get('provider')
-            language = self.app_settings_service.get_language()
-            
-            if not conversation_id:
-                return error_response(language, 'error_messages.conversation_id_required')
-            
-            if not feedback:
-                return error_response(language, 'error_messages.feedback_required')
-            
-            if not provider:
-                return error_response(language, 'error_messages.provider_required')
-            
-            result = self.story_generation_service.modify_section(
-                conversation_id=conversation_id,
-                feedback=feedback,
-                provider=provider,
-                model=data.get('model')
-            )
-            
-            return jsonify(result)
-        
-        except Exception as e:
-            logger.error(f"Error in modify_section: {str(e)}", exc_info=True)
-            return jsonify({
-                "success": False,
-                "error": f"Server error: {str(e)}"
-            }), 500
+        data, error = self._story_payload('conversation_id', 'feedback', 'provider')
+        if error:
+            return error
+        
+        result = self.story_generation_service.modify_section(
+            conversation_id=data['conversation_id'],
+            feedback=data['feedback'],
+            provider=data['provider'],
+            model=data.get('model')
+        )
+        return jsonify(result)
 
     def save_user_note(self):
         """Append a free-form user note as a normal user chat row (no AI call)."""
-        data = request.json or {}
+        data = request_json()
         conversation_id = data.get('conversation_id')
         text = (data.get('text') or data.get('message') or '').strip()
         language = self.app_settings_service.get_language()
@@ -992,7 +771,7 @@ class ChatController:
         """
         try:
             provider = request.args.get('provider', 'ollama')
-            logger.info(f"Fetching models for provider: {provider}")
+            logger.info("Fetching models for provider: %s", provider)
 
             capability = get_provider_capability(provider)
             if capability is None:
@@ -1090,18 +869,29 @@ class ChatController:
     @handle_errors
     def get_all_conversations(self):
         """
-        Get all conversation IDs list
+        Get conversation IDs list
+        
+        Query parameters:
+            - limit: Optional page size
+            - offset: Page offset (default 0)
         
         Returns:
             - success: Whether successful
-            - conversations: Conversation IDs list
-            - count: Conversation count
+            - conversations: Conversation IDs list (one page, most recently active first, when limit is given)
+            - count: Total conversation count
         """
-        conversations = self.chat_service.get_all_conversations()
+        limit = request.args.get('limit', type=int)
+        offset = max(request.args.get('offset', 0, type=int), 0)
+        if limit is None:
+            conversations = self.chat_service.get_all_conversations()
+            count = len(conversations)
+        else:
+            conversations = self.chat_service.get_all_conversations(limit=max(limit, 0), offset=offset)
+            count = self.chat_service.get_conversation_count()
         return jsonify({
             "success": True,
             "conversations": conversations,
-            "count": len(conversations)
+            "count": count
         })
     
     @handle_errors
@@ -1116,57 +906,30 @@ class ChatController:
             - success: Whether successful
             - message: Message
         """
-        data = request.json or {}
+        data = request_json()
         conversation_id = data.get('conversation_id')
         language = self.app_settings_service.get_language()
         
         if not conversation_id:
             return error_response(language, 'error_messages.conversation_id_required')
         
-        # Delete all related data for the conversation
-        deleted_messages = False
-        deleted_settings = False
-        deleted_summary = False
-        deleted_characters = 0
-        deleted_progress = False
-        
         try:
-            # 1. Delete chat messages
-            deleted_messages = self.chat_service.delete_conversation(conversation_id)
-            
-            # 2. Delete conversation settings
-            try:
-                deleted_settings = self.conversation_service.delete_settings(conversation_id)
-            except Exception as e:
-                logger.warning(f"Failed to delete settings for conversation {conversation_id}: {str(e)}")
-            
-            # 3. Delete conversation summary
-            try:
-                deleted_summary = self.summary_service.delete_summary(conversation_id)
-            except Exception as e:
-                logger.warning(f"Failed to delete summary for conversation {conversation_id}: {str(e)}")
-            
-            # 4. Delete character records
-            try:
-                deleted_characters = self.character_service.delete_conversation_characters(conversation_id)
-            except Exception as e:
-                logger.warning(f"Failed to delete characters for conversation {conversation_id}: {str(e)}")
-            
-            # 5. Delete story progress
-            try:
-                deleted_progress = self.story_service.delete_progress(conversation_id)
-            except Exception as e:
-                logger.warning(f"Failed to delete progress for conversation {conversation_id}: {str(e)}")
+            # Messages, settings, summary, characters and progress go in one transaction
+            deleted = self.chat_orchestration_service.delete_conversation_cascade(conversation_id)
             
             # Consider deletion successful if at least messages were deleted
             # (other data might not exist)
-            success = deleted_messages
+            success = deleted['messages']
             
             logger.info(
-                f"Deleted conversation {conversation_id}: "
-                f"messages={deleted_messages}, settings={deleted_settings}, "
-                f"summary={deleted_summary}, characters={deleted_characters}, "
-                f"progress={deleted_progress}"
+                "Deleted conversation %s: messages=%s, settings=%s, summary=%s, "
+                "characters=%s, progress=%s",
+                conversation_id,
+                deleted['messages'],
+                deleted['settings'],
+                deleted['summary'],
+                deleted['characters'],
+                deleted['progress'],
             )
             
             return jsonify({
@@ -1227,16 +990,16 @@ class ChatController:
             - success: Whether successful
             - summary: Generated summary content
         """
-        data = request.json or {}
+        data = request_json()
         conversation_id = data.get('conversation_id')
+        provider = data.get('provider')
         language = self.app_settings_service.get_language()
         
-        if not conversation_id:
-            return error_response(language, 'error_messages.conversation_id_required')
-        
-        provider = data.get('provider')
-        if not provider:
-            return error_response(language, 'error_messages.provider_required')
+        error = validate_required_fields(
+            language, {'conversation_id': conversation_id, 'provider': provider}
+        )
+        if error:
+            return error
         
         result = self.summary_orchestration_service.generate_summary(
             conversation_id=conversation_id,
@@ -1262,16 +1025,16 @@ class ChatController:
             - success: Whether successful
             - summary: Saved summary
         """
-        data = request.json or {}
+        data = request_json()
         conversation_id = data.get('conversation_id')
         summary_text = data.get('summary')
         language = self.app_settings_service.get_language()
         
-        if not conversation_id:
-            return error_response(language, 'error_messages.conversation_id_required')
-        
-        if not summary_text:
-            return error_response(language, 'error_messages.summary_required')
+        error = validate_required_fields(
+            language, {'conversation_id': conversation_id, 'summary': summary_text}
+        )
+        if error:
+            return error
         
         messages = self.chat_service.get_conversation(conversation_id)
         message_count = len(messages)
@@ -1298,40 +1061,31 @@ class ChatController:
             - success: Success flag
             - message: Status message
         """
-        try:
-            data = request.json or {}
-            conversation_id = data.get('conversation_id')
+        data = request_json()
+        conversation_id = data.get('conversation_id')
+        
+        if not conversation_id:
+            # Only the error path needs the UI language
             language = self.app_settings_service.get_language()
-            
-            if not conversation_id:
-                return error_response(language, 'error_messages.conversation_id_required')
-            
-            deleted_message = self.chat_service.delete_last_message(conversation_id)
-            
-            if deleted_message:
-                # Handle character records
-                self.character_service.handle_message_deletion(
-                    conversation_id=conversation_id,
-                    message_id=deleted_message.get('id'),
-                    message_content=deleted_message.get('content') if deleted_message.get('role') == 'assistant' else None,
-                    message_role=deleted_message.get('role')
-                )
-                return jsonify({
-                    "success": True,
-                    "message": "Last message deleted successfully"
-                })
-            else:
-                return jsonify({
-                    "success": False,
-                    "error": "No message found to delete"
-                }), 404
+            return error_response(language, 'error_messages.conversation_id_required')
+        if not isinstance(conversation_id, str) or len(conversation_id) > MAX_CONVERSATION_ID_LEN:
+            # No stored conversation can have this id; skip the transaction
+            return jsonify({"success": False, "error": "No message found to delete"}), 404
         
+        try:
+            # Message delete and character rollback share one transaction
+            deleted_message = self.chat_orchestration_service.delete_last_message(conversation_id)
         except Exception as e:
-            logger.error(f"Failed to delete last message: {str(e)}", exc_info=True)
+            detail = str(e)
+            logger.error("Failed to delete last message: %s", detail, exc_info=True)
             return jsonify({
                 "success": False,
-                "error": f"Failed to delete last message: {str(e)}"
+                "error": f"Failed to delete last message: {detail[:_MAX_ERROR_DETAIL_LEN]}"
             }), 500
+        
+        if deleted_message:
+            return jsonify({"success": True, "message": "Last message deleted successfully"})
+        return jsonify({"success": False, "error": "No message found to delete"}), 404
 
     def get_assistant_variants(self):
         data = request.args
@@ -1346,7 +1100,7 @@ class ChatController:
         })
 
     def restore_assistant_variant(self):
-        data = request.json or {}
+        data = request_json()
         conversation_id = data.get('conversation_id')
         message_id = data.get('message_id')
         language = self.app_settings_service.get_language()
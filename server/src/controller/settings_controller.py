@@ -15,13 +15,35 @@ from service.chat_service import ChatService
 from infrastructure.provider_capabilities import get_supported_providers
 from utils.logger import get_logger
 from utils.stream_response import create_stream_response
-from utils.controller_helpers import error_response, handle_errors
+from utils.controller_helpers import error_response, handle_errors, validate_required_fields, request_json
 import json
 from pathlib import Path
 
 logger = get_logger(__name__)
 
 
+# (rule, HTTP method, controller method); each method is also the endpoint name
+_ROUTES = (
+    ('/api/conversations/list', 'GET', 'get_conversations_list'),
+    ('/api/conversation/settings', 'GET', 'get_conversation_settings'),
+    ('/api/conversation/settings', 'POST', 'create_or_update_settings'),
+    ('/api/conversation/generate-outline', 'POST', 'generate_outline'),
+    ('/api/conversation/generate-outline-stream', 'POST', 'generate_outline_stream'),
+    ('/api/conversation/progress', 'GET', 'get_progress'),
+    ('/api/conversation/progress/confirm-outline', 'POST', 'confirm_outline'),
+    ('/api/conversation/progress', 'POST', 'update_progress'),
+    ('/api/app-settings/language', 'GET', 'get_language'),
+    ('/api/app-settings/language', 'POST', 'set_language'),
+    ('/api/app-settings', 'GET', 'get_app_settings'),
+    ('/api/app-settings', 'POST', 'save_app_settings'),
+    ('/api/conversation/characters', 'GET', 'get_characters'),
+    ('/api/conversation/characters/update', 'POST', 'update_character'),
+    ('/api/conversation/characters/generate', 'POST', 'generate_character'),
+    ('/api/conversation/characters/generate-stream', 'POST', 'generate_character_stream'),
+    ('/api/story-templates', 'GET', 'list_story_templates'),
+)
+
+
 class SettingsController:
     """Conversation settings controller"""
     
@@ -64,74 +86,9 @@ class SettingsController:
         Args:
             app: Flask app instance
         """
-        @app.route('/api/conversations/list', methods=['GET'])
-        def get_conversations_list():
-            return self.get_conversations_list()
-        
-        @app.route('/api/conversation/settings', methods=['GET'])
-        def get_conversation_settings():
-            return self.get_conversation_settings()
-        
-        @app.route('/api/conversation/settings', methods=['POST'])
-        def create_or_update_settings():
-            return self.create_or_update_settings()
-        
-        @app.route('/api/conversation/generate-outline', methods=['POST'])
-        def generate_outline():
-            return self.generate_outline()
-        
-        @app.route('/api/conversation/generate-outline-stream', methods=['POST'])
-        def generate_outline_stream():
-            return self.generate_outline_stream()
-        
-        @app.route('/api/conversation/progress', methods=['GET'])
-        def get_progress():
-            return self.get_progress()
-        
-        @app.route('/api/conversation/progress/confirm-outline', methods=['POST'])
-        def confirm_outline():
-            return self.confirm_outline()
-        
-        @app.route('/api/conversation/progress', methods=['POST'])
-        def update_progress():
-            return self.update_progress()
-        
-        @app.route('/api/app-settings/language', methods=['GET'])
-        def get_language():
-            return self.get_language()
-        
-        @app.route('/api/app-settings/language', methods=['POST'])
-        def set_language():
-            return self.set_language()
-        
-        @app.route('/api/app-settings', methods=['GET'])
-        def get_app_settings():
-            return self.get_app_settings()
-        
-        @app.route('/api/app-settings', methods=['POST'])
-        def save_app_settings():
-            return self.save_app_settings()
-        
-        @app.route('/api/conversation/characters', methods=['GET'])
-        def get_characters():
-            return self.get_characters()
-        
-        @app.route('/api/conversation/characters/update', methods=['POST'])
-        def update_character():
-            return self.update_character()
-        
-        @app.route('/api/conversation/characters/generate', methods=['POST'])
-        def generate_character():
-            return self.generate_character()
-        
-        @app.route('/api/conversation/characters/generate-stream', methods=['POST'])
-        def generate_character_stream():
-            return self.generate_character_stream()
+        for rule, method, name in _ROUTES:
+            app.add_url_rule(rule, endpoint=name, view_func=getattr(self, name), methods=[method])
 
-        @app.route('/api/story-templates', methods=['GET'])
-        def list_story_templates():
-            return self.list_story_templates()
-    
     @handle_errors
     def get_conversations_list(self):
         """
@@ -193,7 +150,7 @@ class SettingsController:
             - success: Success flag
             - settings: Saved settings (without API Key)
         """
-        data = request.json or {}
+        data = request_json()
         conversation_id = data.get('conversation_id')
         language = self.app_settings_service.get_language()
         
@@ -233,7 +190,7 @@ class SettingsController:
             - outline: Generated outline content
         """
         try:
-            data = request.json or {}
+            data = request_json()
             background = data.get('background')
             language = self.app_settings_service.get_language()
             
@@ -289,7 +246,7 @@ class SettingsController:
         Returns:
             Server-Sent Events stream with outline chunks
         """
-        data = request.json or {}
+        data = request_json()
         background = data.get('background')
         language = self.app_settings_service.get_language()
         
@@ -352,7 +309,7 @@ class SettingsController:
         Returns:
             - success: Success flag
         """
-        data = request.json or {}
+        data = request_json()
         conversation_id = data.get('conversation_id')
         language = self.app_settings_service.get_language()
         
@@ -385,7 +342,7 @@ class SettingsController:
             - success: Success flag
             - progress: Updated progress
         """
-        data = request.json or {}
+        data = request_json()
         conversation_id = data.get('conversation_id')
         language = self.app_settings_service.get_language()
         
@@ -439,7 +396,7 @@ class SettingsController:
             - success: Success flag
             - language: Language code
         """
-        data = request.json or {}
+        data = request_json()
         language = data.get('language')
         app_language = self.app_settings_service.get_language()
         
@@ -492,7 +449,7 @@ class SettingsController:
             - success: Success flag
         """
         try:
-            data = request.json or {}
+            data = request_json()
             settings = data.get('settings')
             
             if settings is None:
@@ -603,15 +560,16 @@ class SettingsController:
             - character: Updated character record
         """
         try:
-            data = request.json or {}
+            data = request_json()
             conversation_id = data.get('conversation_id')
             name = data.get('name')
             language = self.app_settings_service.get_language()
             
-            if not conversation_id:
-                return error_response(language, 'error_messages.conversation_id_required')
-            if not name:
-                return error_response(language, 'error_messages.name_required')
+            error = validate_required_fields(
+                language, {'conversation_id': conversation_id, 'name': name}
+            )
+            if error:
+                return error
             
             character = self.character_service.update_character(
                 conversation_id=conversation_id,
@@ -657,7 +615,7 @@ class SettingsController:
             - character: Generated character information (name and personality)
         """
         try:
-            data = request.json or {}
+            data = request_json()
             conversation_id = data.get('conversation_id')
             
             # Get language setting
@@ -706,7 +664,7 @@ class SettingsController:
         Returns:
             Server-Sent Events stream with character generation chunks
         """
-        data = request.json or {}
+        data = request_json()
         conversation_id = data.get('conversation_id')
         language = self.app_settings_service.get_language()
         
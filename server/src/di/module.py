@@ -252,6 +252,9 @@ class AppModule(Module):
         ai_config_service: AIConfigService,
         conversation_service: ConversationService,
         attachment_storage_service: AttachmentStorageService,
+        summary_service: SummaryService,
+        character_service: CharacterService,
+        story_service: StoryService,
     ) -> ChatOrchestrationService:
         """
         Create chat orchestration service
@@ -265,6 +268,9 @@ class AppModule(Module):
             ai_config_service=ai_config_service,
             conversation_service=conversation_service,
             attachment_storage_service=attachment_storage_service,
+            summary_service=summary_service,
+            character_service=character_service,
+            story_service=story_service,
         )
     
     @provider
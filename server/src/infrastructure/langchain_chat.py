@@ -5,6 +5,7 @@ Uses ``langchain_ollama.ChatOllama`` and ``langchain_openai.ChatOpenAI`` (DeepSe
 """
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Dict, Generator, List, Optional
 
 from langchain_core.language_models.chat_models import BaseChatModel
@@ -131,6 +132,33 @@ def get_chat_model(
     )
 
 
+@lru_cache(maxsize=32)
+def _shared_chat_model(
+    provider: str,
+    model: str,
+    api_key: Optional[str],
+    base_url: Optional[str],
+    max_tokens: int,
+    temperature: float,
+    ollama_base_url: Optional[str],
+) -> BaseChatModel:
+    """
+    Reuse chat model instances across requests.
+
+    Each ChatOllama instance opens its own httpx clients, so building one per request
+    discards the connection pool every call. Instances are safe to share between threads.
+    """
+    return get_chat_model(
+        provider,
+        model,
+        api_key=api_key,
+        base_url=base_url,
+        max_tokens=max_tokens,
+        temperature=temperature,
+        ollama_base_url=ollama_base_url,
+    )
+
+
 def invoke_langchain_chat(
     provider: str,
     message: str,
@@ -153,14 +181,14 @@ def invoke_langchain_chat(
         message,
         message_parts,
     )
-    chat = get_chat_model(
+    chat = _shared_chat_model(
         provider,
         model,
-        api_key=api_key,
-        base_url=base_url,
-        max_tokens=max_tokens,
-        temperature=temperature,
-        ollama_base_url=ollama_base_url,
+        api_key,
+        base_url,
+        max_tokens,
+        temperature,
+        ollama_base_url,
     )
     runnable = _bind_stop_words(chat, stop_words)
     try:
@@ -201,14 +229,14 @@ def stream_langchain_chat(
         message,
         message_parts,
     )
-    chat = get_chat_model(
+    chat = _shared_chat_model(
         provider,
         model,
-        api_key=api_key,
-        base_url=base_url,
-        max_tokens=max_tokens,
-        temperature=temperature,
-        ollama_base_url=ollama_base_url,
+        api_key,
+        base_url,
+        max_tokens,
+        temperature,
+        ollama_base_url,
     )
     runnable = _bind_stop_words(chat, stop_words)
     try:
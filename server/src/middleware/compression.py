@@ -0,0 +1,55 @@
+"""
+Gzip compression for large JSON responses.
+
+The Tauri client talks to the sidecar over loopback, where compressing costs more CPU
+than it saves in transfer, so loopback peers are always served uncompressed. Remote
+clients that advertise gzip get JSON bodies above COMPRESS_MIN_SIZE compressed.
+Streamed responses (SSE) are never buffered for compression.
+"""
+from __future__ import annotations
+
+import gzip
+from typing import TYPE_CHECKING
+
+from flask import Response, request
+
+if TYPE_CHECKING:
+    from flask import Flask
+
+COMPRESSIBLE_MIMETYPES = frozenset({'application/json', 'application/msgpack'})
+LOOPBACK_ADDRS = frozenset({'127.0.0.1', '::1', 'localhost'})
+
+
+def _should_compress(response: Response, min_size: int) -> bool:
+    if request.remote_addr in LOOPBACK_ADDRS:
+        return False
+    if 'gzip' not in request.headers.get('Accept-Encoding', '').lower():
+        return False
+    if response.mimetype not in COMPRESSIBLE_MIMETYPES:
+        return False
+    if response.direct_passthrough or response.is_streamed:
+        return False
+    if response.status_code < 200 or response.status_code >= 300:
+        return False
+    if 'Content-Encoding' in response.headers:
+        return False
+    return (response.content_length or 0) >= min_size
+
+
+def register_compression(app: Flask) -> None:
+    """Register after_request gzip handler using app.config (populated from Config)."""
+    min_size = int(app.config.get('COMPRESS_MIN_SIZE', 1024))
+    level = int(app.config.get('COMPRESS_LEVEL', 4))
+
+    # Response is imported at runtime: FlaskInjector resolves hook type hints
+    @app.after_request
+    def _gzip_response(response: Response) -> Response:
+        # Any compressible response may be gzipped for another request to the same URL,
+        # so caches must key it on Accept-Encoding even when this one goes out plain
+        if response.mimetype in COMPRESSIBLE_MIMETYPES:
+            response.vary.add('Accept-Encoding')
+        if not _should_compress(response, min_size):
+            return response
+        response.set_data(gzip.compress(response.get_data(), compresslevel=level))
+        response.headers['Content-Encoding'] = 'gzip'
+        return response
@@ -1,6 +1,7 @@
 """
 Conversation settings data model
 """
+import json
 from datetime import datetime
 from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean
 
@@ -26,7 +27,6 @@ class ConversationSettings(Base):
     
     def to_dict(self) -> dict:
         """Convert to dictionary"""
-        import json
         return {
             'id': self.id,
             'conversation_id': self.conversation_id,
@@ -109,8 +109,10 @@ class CharacterRecordRepository:
             logger.info(f"Created character record: conversation_id={conversation_id}, name={name}")
             return character
 
-    def get_character(self, conversation_id: str, name: str) -> Optional[CharacterRecord]:
-        with repository_session(self._session_factory, None) as sess:
+    def get_character(
+        self, conversation_id: str, name: str, session: Optional[Session] = None
+    ) -> Optional[CharacterRecord]:
+        with repository_session(self._session_factory, session) as sess:
             return (
                 sess.query(CharacterRecord)
                 .filter(
@@ -163,8 +165,10 @@ class CharacterRecordRepository:
             logger.info(f"Updated character: conversation_id={conversation_id}, name={name}")
             return character
 
-    def delete_characters_by_message_id(self, message_id: int) -> int:
-        with repository_session(self._session_factory, None) as sess:
+    def delete_characters_by_message_id(
+        self, message_id: int, session: Optional[Session] = None
+    ) -> int:
+        with repository_session(self._session_factory, session) as sess:
             deleted = (
                 sess.query(CharacterRecord)
                 .filter(CharacterRecord.first_appeared_message_id == message_id)
@@ -173,8 +177,10 @@ class CharacterRecordRepository:
             logger.info(f"Deleted {deleted} character records for message_id={message_id}")
             return deleted
 
-    def delete_characters_by_conversation(self, conversation_id: str) -> int:
-        with repository_session(self._session_factory, None) as sess:
+    def delete_characters_by_conversation(
+        self, conversation_id: str, session: Optional[Session] = None
+    ) -> int:
+        with repository_session(self._session_factory, session) as sess:
             deleted = (
                 sess.query(CharacterRecord)
                 .filter(CharacterRecord.conversation_id == conversation_id)
@@ -3,7 +3,7 @@ Chat record data access layer
 """
 from typing import List, Optional, Dict
 from datetime import datetime
-from sqlalchemy import desc, text
+from sqlalchemy import desc, func, text
 from sqlalchemy.orm import Session, sessionmaker
 
 from model.chat_record import ChatRecord
@@ -54,7 +54,7 @@ class ChatRepository:
             sess.add(record)
             sess.flush()
             sess.refresh(record)
-            logger.info(f"Saved message: conversation_id={conversation_id}, role={role}")
+            logger.info("Saved message: conversation_id=%s, role=%s", conversation_id, role)
             return record
 
     def get_conversation_messages(
@@ -75,6 +75,22 @@ class ChatRepository:
                 query = query.limit(limit)
             return query.all()
 
+    def get_recent_messages(
+        self,
+        conversation_id: str,
+        limit: int,
+    ) -> List[ChatRecord]:
+        with repository_session(self._session_factory, None) as sess:
+            rows = (
+                sess.query(ChatRecord)
+                .filter(ChatRecord.conversation_id == conversation_id)
+                .order_by(desc(ChatRecord.created_at), desc(ChatRecord.id))
+                .limit(limit)
+                .all()
+            )
+            rows.reverse()
+            return rows
+
     def get_assistant_messages(
         self,
         conversation_id: str,
@@ -108,17 +124,31 @@ class ChatRepository:
                 .first()
             )
 
-    def get_all_conversations(self) -> List[str]:
+    def get_all_conversations(
+        self, limit: Optional[int] = None, offset: int = 0
+    ) -> List[str]:
         with repository_session(self._session_factory, None) as sess:
-            result = sess.query(ChatRecord.conversation_id).distinct().all()
-            return [row[0] for row in result]
+            if limit is None:
+                query = sess.query(ChatRecord.conversation_id).distinct()
+            else:
+                # Most recently active first; the id breaks ties so pages stay stable
+                query = (
+                    sess.query(ChatRecord.conversation_id)
+                    .group_by(ChatRecord.conversation_id)
+                    .order_by(desc(func.max(ChatRecord.created_at)), ChatRecord.conversation_id)
+                    .limit(limit)
+                    .offset(offset)
+                )
+            return [row[0] for row in query.all()]
 
-    def delete_conversation(self, conversation_id: str) -> bool:
-        with repository_session(self._session_factory, None) as sess:
+    def delete_conversation(
+        self, conversation_id: str, session: Optional[Session] = None
+    ) -> bool:
+        with repository_session(self._session_factory, session) as sess:
             deleted = sess.query(ChatRecord).filter(
                 ChatRecord.conversation_id == conversation_id
             ).delete()
-            logger.info(f"Deleted conversation: {conversation_id}, {deleted} messages")
+            logger.info("Deleted conversation: %s, %d messages", conversation_id, deleted)
             return deleted > 0
 
     def get_conversation_count(self) -> int:
@@ -137,8 +167,10 @@ class ChatRepository:
                 .first()
             )
 
-    def delete_last_message(self, conversation_id: str) -> Optional[ChatRecord]:
-        with repository_session(self._session_factory, None) as sess:
+    def delete_last_message(
+        self, conversation_id: str, session: Optional[Session] = None
+    ) -> Optional[ChatRecord]:
+        with repository_session(self._session_factory, session) as sess:
             last_message = (
                 sess.query(ChatRecord)
                 .filter(ChatRecord.conversation_id == conversation_id)
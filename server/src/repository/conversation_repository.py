@@ -161,8 +161,10 @@ class ConversationRepository:
             )
             return [s.to_dict() for s in settings_list]
 
-    def delete_settings(self, conversation_id: str) -> bool:
-        with repository_session(self._session_factory, None) as sess:
+    def delete_settings(
+        self, conversation_id: str, session: Optional[Session] = None
+    ) -> bool:
+        with repository_session(self._session_factory, session) as sess:
             deleted = (
                 sess.query(ConversationSettings)
                 .filter(ConversationSettings.conversation_id == conversation_id)
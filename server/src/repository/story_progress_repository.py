@@ -105,8 +105,10 @@ class StoryProgressRepository:
             logger.info(f"Marked outline confirmed for conversation: {conversation_id}")
             return True
 
-    def delete_progress(self, conversation_id: str) -> bool:
-        with repository_session(self._session_factory, None) as sess:
+    def delete_progress(
+        self, conversation_id: str, session: Optional[Session] = None
+    ) -> bool:
+        with repository_session(self._session_factory, session) as sess:
             deleted = (
                 sess.query(StoryProgress)
                 .filter(StoryProgress.conversation_id == conversation_id)
@@ -64,8 +64,10 @@ class SummaryRepository:
                 .first()
             )
 
-    def delete_summary(self, conversation_id: str) -> bool:
-        with repository_session(self._session_factory, None) as sess:
+    def delete_summary(
+        self, conversation_id: str, session: Optional[Session] = None
+    ) -> bool:
+        with repository_session(self._session_factory, session) as sess:
             deleted = (
                 sess.query(ConversationSummary)
                 .filter(ConversationSummary.conversation_id == conversation_id)
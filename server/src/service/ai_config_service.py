@@ -2,9 +2,11 @@
 Global AI configuration service layer
 """
 from typing import Optional, Dict, List
+from config import Config
 from infrastructure.provider_capabilities import get_provider_capability
 from repository.ai_config_repository import AIConfigRepository
 from utils.logger import get_logger
+from utils.ttl_cache import TTLCache
 
 logger = get_logger(__name__)
 
@@ -20,6 +22,8 @@ class AIConfigService:
             ai_config_repository: AI config repository instance
         """
         self.repository = ai_config_repository
+        # provider -> (stored config dict or None,); every chat call reads it, saves clear it
+        self._api_config_cache = TTLCache(maxsize=16, ttl=Config.AI_CONFIG_CACHE_TTL)
     
     def get_config(self, provider: str, include_api_key: bool = True) -> Optional[Dict]:
         """
@@ -82,8 +86,25 @@ class AIConfigService:
             max_tokens=max_tokens,
             temperature=temperature
         )
+        self._api_config_cache.clear()
         return config.to_dict(include_api_key=False)
     
+    def _get_cached_api_config(self, provider: str) -> Optional[Dict]:
+        """
+        Get the stored config (with API Key) through the short-lived cache
+        
+        Args:
+            provider: AI provider
+        
+        Returns:
+            Config dictionary, or None if not exists
+        """
+        cached = self._api_config_cache.get(provider)
+        if cached is None:
+            cached = (self.get_config(provider, include_api_key=True),)
+            self._api_config_cache.set(provider, cached)
+        return cached[0]
+    
     def get_config_for_api(
         self,
         provider: str,
@@ -112,7 +133,7 @@ class AIConfigService:
                 'temperature': 0.7
             }
         
-        global_config = self.get_config(provider, include_api_key=True)
+        global_config = self._get_cached_api_config(provider)
         if not global_config:
             return {
                 'provider': provider,
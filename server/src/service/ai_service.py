@@ -1,12 +1,18 @@
 """
 Unified AI service interface module
 """
+import hashlib
 from typing import Dict, Optional, List
-from config import get_config
+
+import orjson
+
+from config import Config, get_config
 from infrastructure.langchain_chat import invoke_langchain_chat
 from infrastructure.provider_capabilities import get_provider_capability
 from utils.logger import get_logger
 from utils.exceptions import ProviderError, ValidationError
+from utils.request_coalescer import RequestCoalescer
+from utils.ttl_cache import TTLCache
 from service.ollama_service import OllamaService
 from service.deepseek_service import DeepSeekService
 
@@ -30,6 +36,18 @@ class AIService:
         """
         self.ollama_service = ollama_service
         self.deepseek_service = deepseek_service
+        # Identical concurrent chat calls (double submit, parallel retries) share one upstream call
+        self._chat_coalescer = RequestCoalescer()
+        self._chat_cache = TTLCache(
+            maxsize=Config.CHAT_RESPONSE_CACHE_MAXSIZE,
+            ttl=Config.CHAT_RESPONSE_CACHE_TTL,
+        )
+        # Installed models change rarely; avoid a /api/tags round-trip per UI refresh
+        self._models_cache = TTLCache(maxsize=8, ttl=Config.MODELS_CACHE_TTL)
+        self._models_coalescer = RequestCoalescer()
+        # Health pollers hit this at 1Hz+; probe Ollama at most once per short window
+        self._health_cache = TTLCache(maxsize=1, ttl=Config.HEALTH_CACHE_TTL)
+        self._health_coalescer = RequestCoalescer()
     
     def chat(
         self,
@@ -69,6 +87,53 @@ class AIService:
         if not message and not messages:
             raise ValidationError("Message or messages cannot be empty", field='message')
 
+        call_args = dict(
+            provider=provider,
+            message=message,
+            model=model,
+            api_key=api_key,
+            base_url=base_url,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system_prompt=system_prompt,
+            messages=messages,
+            stop_words=stop_words,
+            message_parts=message_parts,
+        )
+        call_key = hashlib.blake2b(
+            orjson.dumps(call_args, option=orjson.OPT_SORT_KEYS, default=str),
+            digest_size=16,
+        ).hexdigest()
+        # Only greedy (temperature 0) output is reproducible; sampled replies must stay
+        # fresh so regenerate and story generation still produce new text
+        cacheable = temperature == 0
+        if cacheable:
+            cached = self._chat_cache.get(call_key)
+            if cached is not None:
+                logger.debug("Chat response cache hit")
+                return dict(cached)
+
+        result = self._chat_coalescer.run(call_key, lambda: self._dispatch_chat(**call_args))
+        if cacheable:
+            self._chat_cache.set(call_key, result)
+        # Callers annotate the result dict; give each its own copy
+        return dict(result)
+
+    def _dispatch_chat(
+        self,
+        provider: str,
+        message: str,
+        model: str,
+        api_key: Optional[str],
+        base_url: Optional[str],
+        max_tokens: int,
+        temperature: float,
+        system_prompt: Optional[str],
+        messages: Optional[list],
+        stop_words: Optional[List[str]],
+        message_parts: Optional[List[dict]],
+    ) -> Dict:
+        """Route a validated chat request to LangChain or the legacy provider clients"""
         cfg = get_config()
         if cfg.USE_LANGCHAIN:
             try:
@@ -247,10 +312,10 @@ class AIService:
                 stop_words=stop_words,
             )
             
-            choices = result.get('choices', [])
-            if choices:
-                response_content = choices[0].get('message', {}).get('content', '')
-            else:
+            # EAFP: the happy path indexes straight through without default containers
+            try:
+                response_content = result['choices'][0]['message']['content']
+            except (KeyError, IndexError, TypeError):
                 response_content = ''
             
             return {
@@ -283,10 +348,15 @@ class AIService:
         """
         if provider == 'ollama':
             try:
-                models = self.ollama_service.list_models()
+                models = self._models_cache.get(provider)
+                if models is None:
+                    models = self._models_coalescer.run(
+                        provider, self.ollama_service.list_models
+                    )
+                    self._models_cache.set(provider, models)
                 return {
                     "success": True,
-                    "models": models
+                    "models": list(models)
                 }
             except ProviderError:
                 raise
@@ -315,7 +385,12 @@ class AIService:
             Health status dictionary
         """
         if provider == 'ollama':
-            is_healthy = self.ollama_service.health_check()
+            is_healthy = self._health_cache.get(provider)
+            if is_healthy is None:
+                is_healthy = self._health_coalescer.run(
+                    provider, self.ollama_service.health_check
+                )
+                self._health_cache.set(provider, is_healthy)
             return {
                 "status": "healthy" if is_healthy else "unhealthy",
                 "ollama_available": is_healthy
@@ -165,50 +165,13 @@ class AIServiceStreaming:
             
             full_prompt += f"用户：{message}\n\n助手："
             
-            # Stream from Ollama
-            url = f"{self.ollama_service.base_url}/api/generate"
-            payload = {
-                "model": model,
-                "prompt": full_prompt,
-                "stream": True
-            }
-            
-            response = requests.post(
-                url,
-                json=payload,
-                stream=True,
-                timeout=self.ollama_service.timeout
-            )
-            
-            if response.status_code != 200:
-                error_msg = f"Ollama API error: {response.status_code}"
-                logger.error(f"{error_msg} - {response.text}")
-                raise ProviderError(
-                    error_msg,
-                    provider='ollama',
-                    status_code=response.status_code
-                )
-            
-            for line in response.iter_lines():
-                if line:
-                    try:
-                        data = json.loads(line)
-                        if 'response' in data:
-                            yield data['response']
-                        if data.get('done', False):
-                            break
-                    except json.JSONDecodeError:
-                        continue
-                        
-        except requests.exceptions.RequestException as e:
-            error_msg = f"Failed to connect to Ollama: {str(e)}"
-            logger.error(error_msg)
-            raise ProviderError(
-                error_msg,
-                provider='ollama',
-                status_code=503,
-                error_code='NETWORK_UNREACHABLE',
+            yield from self.ollama_service.generate_stream(
+                model=model,
+                prompt=full_prompt
             )
+        
+        except ProviderError:
+            raise
         except Exception as e:
             logger.error(f"Unexpected error in Ollama streaming: {str(e)}")
             raise ProviderError(
@@ -281,42 +244,43 @@ class AIServiceStreaming:
             if stop_words:
                 payload["stop"] = stop_words
             
-            response = requests.post(
+            # Pooled session keeps the TLS connection alive between streams; the
+            # with-block returns it to the pool even if the client disconnects early
+            with self.deepseek_service.session.post(
                 url,
                 headers=headers,
                 json=payload,
                 stream=True,
                 timeout=self.deepseek_service.timeout
-            )
-            
-            if response.status_code != 200:
-                error_msg = f"DeepSeek API error: {response.status_code}"
-                logger.error(f"{error_msg} - {response.text}")
-                raise ProviderError(
-                    error_msg,
-                    provider='deepseek',
-                    status_code=response.status_code
-                )
+            ) as response:
+                if response.status_code != 200:
+                    error_msg = f"DeepSeek API error: {response.status_code}"
+                    logger.error(f"{error_msg} - {response.text}")
+                    raise ProviderError(
+                        error_msg,
+                        provider='deepseek',
+                        status_code=response.status_code
+                    )
             
-            for line in response.iter_lines():
-                if line:
-                    line_str = line.decode('utf-8')
-                    if line_str.startswith('data: '):
-                        data_str = line_str[6:]  # Remove 'data: ' prefix
-                        if data_str == '[DONE]':
-                            break
-                        try:
-                            data = json.loads(data_str)
-                            choices = data.get('choices', [])
-                            if choices:
-                                delta = choices[0].get('delta', {})
-                                content = delta.get('content', '')
-                                # Only yield non-empty content
-                                # Skip empty strings and whitespace-only content
-                                if content and content.strip():
-                                    yield content
-                        except json.JSONDecodeError:
-                            continue
+                for line in response.iter_lines():
+                    if line:
+                        line_str = line.decode('utf-8')
+                        if line_str.startswith('data: '):
+                            data_str = line_str[6:]  # Remove 'data: ' prefix
+                            if data_str == '[DONE]':
+                                break
+                            try:
+                                data = json.loads(data_str)
+                                choices = data.get('choices', [])
+                                if choices:
+                                    delta = choices[0].get('delta', {})
+                                    content = delta.get('content', '')
+                                    # Only yield non-empty content
+                                    # Skip empty strings and whitespace-only content
+                                    if content and content.strip():
+                                        yield content
+                            except json.JSONDecodeError:
+                                continue
                             
         except requests.exceptions.RequestException as e:
             error_msg = f"Failed to connect to DeepSeek: {str(e)}"
@@ -327,6 +291,8 @@ class AIServiceStreaming:
                 status_code=503,
                 error_code='NETWORK_UNREACHABLE',
             )
+        except ProviderError:
+            raise
         except Exception as e:
             logger.error(f"Unexpected error in DeepSeek streaming: {str(e)}")
             raise ProviderError(
@@ -28,10 +28,13 @@ class AppSettingsService:
         """
         Get language setting (with caching)
         
+        Process-wide TTL cache, so repeated calls within one request are already
+        attribute reads rather than DB queries.
+        
         Returns:
             Language code ('zh' or 'en'), defaults to 'zh'
         """
-        current_time = time.time()
+        current_time = time.monotonic()
         if (self._language_cache is not None and 
             (current_time - self._language_cache_time) < self._language_cache_ttl):
             return self._language_cache
@@ -59,7 +62,7 @@ class AppSettingsService:
         
         setting = self.repository.set_setting('language', language)
         self._language_cache = language
-        self._language_cache_time = time.time()
+        self._language_cache_time = time.monotonic()
         return setting.to_dict()
     
     def get_setting(self, key: str, default: Optional[str] = None) -> Optional[str]:
@@ -1,12 +1,16 @@
 """
 Character service layer
 """
+import json
 import re
 from typing import List, Optional, Dict, Generator, Tuple, TYPE_CHECKING, Any
+from sqlalchemy.orm import Session
 from infrastructure.provider_capabilities import get_provider_capability
 from repository.character_record_repository import CharacterRecordRepository
 from repository.chat_repository import ChatRepository
+from utils.i18n import get_i18n_text
 from utils.logger import get_logger
+from utils.prompt_template_loader import PromptTemplateLoader
 
 if TYPE_CHECKING:
     from service.conversation_service import ConversationService
@@ -106,7 +110,6 @@ class CharacterService:
             language = 'zh'  # Default to Chinese
         
         # Load status keywords from template
-        from utils.prompt_template_loader import PromptTemplateLoader
         template = PromptTemplateLoader.get_template(language)
         status_keywords = template.get('output_requirements', {}).get('character_changes', {}).get('status_keywords', {})
         
@@ -431,7 +434,8 @@ class CharacterService:
         conversation_id: str,
         message_id: int,
         message_content: Optional[str] = None,
-        message_role: Optional[str] = None
+        message_role: Optional[str] = None,
+        session: Optional[Session] = None,
     ) -> int:
         """
         Handle character records when a message is deleted
@@ -443,11 +447,12 @@ class CharacterService:
             message_id: Message ID that was deleted
             message_content: Optional message content (if assistant message, used to revert status changes)
             message_role: Optional message role (to determine if we need to revert status changes)
+            session: Optional outer session (shared transaction)
         
         Returns:
             Number of character records deleted
         """
-        deleted_count = self.repository.delete_characters_by_message_id(message_id)
+        deleted_count = self.repository.delete_characters_by_message_id(message_id, session=session)
         
         # If it's an assistant message with content, try to revert status changes
         if message_role == 'assistant' and message_content:
@@ -458,7 +463,9 @@ class CharacterService:
                 # Revert status changes that occurred in this message
                 if character_info.get("status_changes"):
                     for char_name, status_changes in character_info["status_changes"].items():
-                        existing_char = self.repository.get_character(conversation_id, char_name)
+                        existing_char = self.repository.get_character(
+                            conversation_id, char_name, session=session
+                        )
                         if existing_char:
                             # Revert status changes
                             updates = {}
@@ -478,6 +485,7 @@ class CharacterService:
                                 self.repository.update_character(
                                     conversation_id=conversation_id,
                                     name=char_name,
+                                    session=session,
                                     **updates
                                 )
                                 logger.info(f"Reverted status changes for character {char_name} after message deletion")
@@ -487,7 +495,9 @@ class CharacterService:
         
         return deleted_count
     
-    def delete_conversation_characters(self, conversation_id: str) -> int:
+    def delete_conversation_characters(
+        self, conversation_id: str, session: Optional[Session] = None
+    ) -> int:
         """
         Delete all characters for a conversation
         
@@ -497,7 +507,7 @@ class CharacterService:
         Returns:
             Number of characters deleted
         """
-        return self.repository.delete_characters_by_conversation(conversation_id)
+        return self.repository.delete_characters_by_conversation(conversation_id, session=session)
     
     def _build_character_generation_prompt(
         self,
@@ -524,8 +534,6 @@ class CharacterService:
         Returns:
             Built prompt string
         """
-        from utils.prompt_template_loader import PromptTemplateLoader
-        
         template = PromptTemplateLoader.get_template(language)
         char_template = template['character_generation']
         sections = char_template['sections']
@@ -721,7 +729,6 @@ class CharacterService:
                         character_personality_dict = settings.get('character_personality', {})
         
         if not background:
-            from utils.i18n import get_i18n_text
             error_msg = get_i18n_text(language, 'error_messages.background_required_detailed')
             return {
                 "success": False,
@@ -742,7 +749,7 @@ class CharacterService:
         recent_content = ""
         if self.chat_service:
             try:
-                messages = self.chat_service.get_conversation(conversation_id, limit=10)
+                messages = self.chat_service.get_recent_messages(conversation_id, limit=10)
                 recent_messages = [msg for msg in messages if msg.get('role') == 'assistant']
                 if recent_messages:
                     recent_content = "\n".join([msg.get('content', '')[:500] for msg in recent_messages[-3:]])
@@ -769,7 +776,6 @@ class CharacterService:
         capability = get_provider_capability(provider)
         # Check if API key is required and available
         if capability and capability.requires_api_key and not api_config.get('api_key'):
-            from utils.i18n import get_i18n_text
             error_msg = get_i18n_text(
                 language,
                 'error_messages.provider_api_key_required'
@@ -842,7 +848,6 @@ class CharacterService:
             Text chunks from AI stream
         """
         if not self.conversation_service or not self.ai_service_streaming or not self.ai_config_service or not self.app_settings_service:
-            import json
             yield json.dumps({"error": "Character generation services not available"}) + "\n"
             return
         
@@ -861,8 +866,6 @@ class CharacterService:
                         character_personality_dict = settings.get('character_personality', {})
         
         if not background:
-            import json
-            from utils.i18n import get_i18n_text
             error_msg = get_i18n_text(language, 'error_messages.background_required_detailed')
             yield json.dumps({"error": error_msg}) + "\n"
             return
@@ -881,7 +884,7 @@ class CharacterService:
         recent_content = ""
         if self.chat_service:
             try:
-                messages = self.chat_service.get_conversation(conversation_id, limit=10)
+                messages = self.chat_service.get_recent_messages(conversation_id, limit=10)
                 recent_messages = [msg for msg in messages if msg.get('role') == 'assistant']
                 if recent_messages:
                     recent_content = "\n".join([msg.get('content', '')[:500] for msg in recent_messages[-3:]])
@@ -908,8 +911,6 @@ class CharacterService:
         capability = get_provider_capability(provider)
         # Check if API key is required and available
         if capability and capability.requires_api_key and not api_config.get('api_key'):
-            import json
-            from utils.i18n import get_i18n_text
             error_msg = get_i18n_text(
                 language,
                 'error_messages.provider_api_key_required'
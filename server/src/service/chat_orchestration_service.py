@@ -11,6 +11,9 @@ from service.attachment_storage_service import AttachmentStorageService
 from service.chat_service import ChatService
 from service.ai_config_service import AIConfigService
 from service.conversation_service import ConversationService
+from service.summary_service import SummaryService
+from service.character_service import CharacterService
+from service.story_service import StoryService
 from utils.logger import get_logger
 from utils.i18n import get_i18n_text
 from utils.think_strip import strip_think_content
@@ -28,6 +31,9 @@ class ChatOrchestrationService:
         chat_service: ChatService,
         ai_config_service: AIConfigService,
         conversation_service: ConversationService,
+        summary_service: SummaryService,
+        character_service: CharacterService,
+        story_service: StoryService,
     ):
         """
         Initialize service
@@ -42,6 +48,105 @@ class ChatOrchestrationService:
         self.chat_service = chat_service
         self.ai_config_service = ai_config_service
         self.conversation_service = conversation_service
+        self.summary_service = summary_service
+        self.character_service = character_service
+        self.story_service = story_service
+
+    def delete_conversation_cascade(self, conversation_id: str) -> Dict:
+        """
+        Delete a conversation and all of its related rows in one transaction
+        
+        Args:
+            conversation_id: Conversation ID
+        
+        Returns:
+            Per-table results: messages/settings/summary/progress (bool), characters (count)
+        """
+        with unit_of_work() as session:
+            return {
+                'messages': self.chat_service.delete_conversation(conversation_id, session=session),
+                'settings': self.conversation_service.delete_settings(conversation_id, session=session),
+                'summary': self.summary_service.delete_summary(conversation_id, session=session),
+                'characters': self.character_service.delete_conversation_characters(
+                    conversation_id, session=session
+                ),
+                'progress': self.story_service.delete_progress(conversation_id, session=session),
+            }
+
+    def delete_last_message(self, conversation_id: str) -> Optional[Dict]:
+        """
+        Delete the last message and roll back its character records in one transaction
+        
+        Args:
+            conversation_id: Conversation ID
+        
+        Returns:
+            Deleted message dict, or None if the conversation has no messages
+        """
+        with unit_of_work() as session:
+            deleted_message = self.chat_service.delete_last_message(conversation_id, session=session)
+            if deleted_message:
+                role = deleted_message['role']
+                self.character_service.handle_message_deletion(
+                    conversation_id=conversation_id,
+                    message_id=deleted_message['id'],
+                    message_content=deleted_message['content'] if role == 'assistant' else None,
+                    message_role=role,
+                    session=session,
+                )
+            return deleted_message
+
+    def save_chat_turn(
+        self,
+        conversation_id: str,
+        message: str,
+        reply: str,
+        model: Optional[str],
+        provider: Optional[str],
+        content_type: str = 'text',
+        attachment_ref: Optional[str] = None,
+    ) -> Dict:
+        """
+        Persist a user message, its attachment links and the assistant reply in one transaction
+        
+        Args:
+            conversation_id: Conversation ID
+            message: User message
+            reply: Assistant reply (think content already stripped)
+            model: Model that produced the reply
+            provider: AI provider
+            content_type: Message content type
+            attachment_ref: Serialized attachment references, if any
+        
+        Returns:
+            Saved user message dict
+        """
+        with unit_of_work() as session:
+            user_message = self.chat_service.save_user_message(
+                conversation_id=conversation_id,
+                message=message,
+                content_type=content_type,
+                attachment_ref=attachment_ref,
+                session=session,
+            )
+            asset_refs = _extract_asset_refs(attachment_ref)
+            if asset_refs:
+                self.attachment_storage_service.attach_to_message(
+                    asset_refs=asset_refs,
+                    message_id=int(user_message['id']),
+                    conversation_id=conversation_id,
+                    session=session,
+                )
+            self.chat_service.save_assistant_message(
+                conversation_id=conversation_id,
+                content=reply,
+                model=model,
+                provider=provider,
+                content_type=content_type,
+                attachment_ref=attachment_ref,
+                session=session,
+            )
+        return user_message
 
     @staticmethod
     def _merge_conversation_llm_overrides(
@@ -132,31 +237,15 @@ class ChatOrchestrationService:
                 response_content = result.get('response', '')
                 clean_content = strip_think_content(response_content)
 
-                with unit_of_work() as session:
-                    user_message = self.chat_service.save_user_message(
-                        conversation_id=conversation_id,
-                        message=message,
-                        content_type=content_type,
-                        attachment_ref=attachment_ref,
-                        session=session,
-                    )
-                    asset_refs = _extract_asset_refs(attachment_ref)
-                    if asset_refs:
-                        self.attachment_storage_service.attach_to_message(
-                            asset_refs=asset_refs,
-                            message_id=int(user_message['id']),
-                            conversation_id=conversation_id,
-                            session=session,
-                        )
-                    self.chat_service.save_assistant_message(
-                        conversation_id=conversation_id,
-                        content=clean_content,
-                        model=result.get('model'),
-                        provider=api_config['provider'],
-                        content_type=content_type,
-                        attachment_ref=attachment_ref,
-                        session=session,
-                    )
+                self.save_chat_turn(
+                    conversation_id=conversation_id,
+                    message=message,
+                    reply=clean_content,
+                    model=result.get('model'),
+                    provider=api_config['provider'],
+                    content_type=content_type,
+                    attachment_ref=attachment_ref,
+                )
                 result['conversation_id'] = conversation_id
                 result['persisted'] = True
             except Exception:
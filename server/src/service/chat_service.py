@@ -129,61 +129,117 @@ class ChatService:
             limit=limit,
             offset=offset
         )
+        return self._to_message_rows(records)
+    
+    def get_recent_messages(self, conversation_id: str, limit: int) -> List[Dict]:
+        """
+        Get the latest messages of a conversation, oldest first
+        
+        Args:
+            conversation_id: Conversation ID
+            limit: Number of most recent messages
+        
+        Returns:
+            Messages list
+        """
+        records = self.repository.get_recent_messages(
+            conversation_id=conversation_id,
+            limit=limit
+        )
+        return self._to_message_rows(records)
+    
+    def get_recent_messages_for_api(self, conversation_id: str, limit: int) -> List[Dict]:
+        """
+        Get the latest messages as role/content/parts dicts for a provider call, oldest first
+        
+        Args:
+            conversation_id: Conversation ID
+            limit: Number of most recent messages
+        
+        Returns:
+            Messages list; parts is None for messages without attachments
+        """
+        records = self.repository.get_recent_messages(
+            conversation_id=conversation_id,
+            limit=limit
+        )
+        attachments_by_message = self.attachment_storage_service.list_by_message_ids(
+            [int(record.id) for record in records if record.id is not None]
+        )
+        messages = []
+        for record in records:
+            attachment_items = self._attachment_items(
+                record.id, record.attachment_ref, attachments_by_message
+            )
+            messages.append({
+                'role': record.role,
+                'content': record.content,
+                'parts': _build_parts(record.content, attachment_items) if attachment_items else None,
+            })
+        return messages
+    
+    def _to_message_rows(self, records: List) -> List[Dict]:
+        """Serialize records and attach their attachment/parts metadata"""
         rows = [record.to_dict() for record in records]
         message_ids = [int(row['id']) for row in rows if row.get('id') is not None]
         attachments_by_message = self.attachment_storage_service.list_by_message_ids(
             message_ids
         )
         for row in rows:
-            message_id = row.get('id')
-            attachment_items = []
-            if message_id is not None:
-                attachment_rows = attachments_by_message.get(int(message_id), [])
-                attachment_items = [
-                    {
-                        'type': 'image'
-                        if str(att.get('mime_type', '')).startswith('image/')
-                        else 'file',
-                        'name': att.get('filename'),
-                        'mimeType': att.get('mime_type'),
-                        'sizeBytes': att.get('size_bytes'),
-                        'assetRef': att.get('asset_ref'),
-                        'status': att.get('status'),
-                        'storagePath': att.get('storage_path'),
-                    }
-                    for att in attachment_rows
-                ]
-            if not attachment_items:
-                attachment_items = _parse_attachment_ref(row.get('attachment_ref'))
+            attachment_items = self._attachment_items(
+                row.get('id'), row.get('attachment_ref'), attachments_by_message
+            )
             if attachment_items:
                 row['attachments'] = attachment_items
-                parts = []
-                if row.get('content'):
-                    parts.append({'type': 'text', 'content': row.get('content')})
-                for item in attachment_items:
-                    parts.append(
-                        {
-                            'type': item.get('type', 'file'),
-                            'name': item.get('name'),
-                            'mimeType': item.get('mimeType'),
-                            'sizeBytes': item.get('sizeBytes'),
-                            'assetRef': item.get('assetRef'),
-                            'storagePath': item.get('storagePath'),
-                        }
-                    )
-                row['parts'] = parts
+                row['parts'] = _build_parts(row.get('content'), attachment_items)
         return rows
     
-    def get_all_conversations(self) -> List[str]:
+    @staticmethod
+    def _attachment_items(
+        message_id: Optional[int],
+        attachment_ref: Optional[str],
+        attachments_by_message: Dict[int, List[Dict]],
+    ) -> List[Dict]:
+        """Attachment items from stored rows, falling back to the message's attachment_ref"""
+        attachment_items = []
+        if message_id is not None:
+            attachment_rows = attachments_by_message.get(int(message_id), [])
+            attachment_items = [
+                {
+                    'type': 'image'
+                    if str(att.get('mime_type', '')).startswith('image/')
+                    else 'file',
+                    'name': att.get('filename'),
+                    'mimeType': att.get('mime_type'),
+                    'sizeBytes': att.get('size_bytes'),
+                    'assetRef': att.get('asset_ref'),
+                    'status': att.get('status'),
+                    'storagePath': att.get('storage_path'),
+                }
+                for att in attachment_rows
+            ]
+        if not attachment_items:
+            attachment_items = _parse_attachment_ref(attachment_ref)
+        return attachment_items
+    
+    def get_all_conversations(
+        self, limit: Optional[int] = None, offset: int = 0
+    ) -> List[str]:
         """
-        Get all conversation IDs list
+        Get conversation IDs list
+        
+        Args:
+            limit: Page size (all conversations if None); pages list the most recently active first
+            offset: Page offset, only used with limit
         
         Returns:
             Conversation IDs list
         """
-        return self.repository.get_all_conversations()
+        return self.repository.get_all_conversations(limit=limit, offset=offset)
     
-    def delete_conversation(self, conversation_id: str) -> bool:
+    def delete_conversation(
+        self, conversation_id: str, session: Optional[Session] = None
+    ) -> bool:
         """
         Delete conversation
         
@@ -193,7 +249,7 @@ class ChatService:
         Returns:
             Whether deletion was successful
         """
-        return self.repository.delete_conversation(conversation_id)
+        return self.repository.delete_conversation(conversation_id, session=session)
     
     def get_conversation_count(self) -> int:
         """
@@ -217,17 +273,20 @@ class ChatService:
         message = self.repository.get_last_assistant_message(conversation_id)
         return message.to_dict() if message else None
     
-    def delete_last_message(self, conversation_id: str) -> Optional[Dict]:
+    def delete_last_message(
+        self, conversation_id: str, session: Optional[Session] = None
+    ) -> Optional[Dict]:
         """
         Delete the last message in a conversation
         
         Args:
             conversation_id: Conversation ID
+            session: Optional outer session (shared transaction)
         
         Returns:
             Deleted message dict (with id, role, content) or None if no message found
         """
-        message = self.repository.delete_last_message(conversation_id)
+        message = self.repository.delete_last_message(conversation_id, session=session)
         return message.to_dict() if message else None
 
     def get_assistant_variants(self, conversation_id: str, limit: int = 30) -> List[Dict]:
@@ -339,6 +398,24 @@ class ChatService:
         return self.repository.list_endings(conversation_id)
 
 
+def _build_parts(content: Optional[str], attachment_items: List[Dict]) -> List[Dict]:
+    parts = []
+    if content:
+        parts.append({'type': 'text', 'content': content})
+    for item in attachment_items:
+        parts.append(
+            {
+                'type': item.get('type', 'file'),
+                'name': item.get('name'),
+                'mimeType': item.get('mimeType'),
+                'sizeBytes': item.get('sizeBytes'),
+                'assetRef': item.get('assetRef'),
+                'storagePath': item.get('storagePath'),
+            }
+        )
+    return parts
+
+
 def _parse_attachment_ref(raw_ref: Optional[str]) -> List[Dict[str, Any]]:
     if not raw_ref:
         return []
@@ -2,10 +2,12 @@
 Conversation settings service layer
 """
 from typing import List, Optional, Dict, Generator, TYPE_CHECKING
+from sqlalchemy.orm import Session
 from repository.conversation_repository import ConversationRepository
 from service.ai_service import AIService
 from service.ai_config_service import AIConfigService
 from utils.logger import get_logger
+from utils.think_strip import strip_think_content
 
 if TYPE_CHECKING:
     from service.ai_service_streaming import AIServiceStreaming
@@ -98,7 +100,9 @@ class ConversationService:
         """
         return self.repository.get_all_conversations_with_settings()
     
-    def delete_settings(self, conversation_id: str) -> bool:
+    def delete_settings(
+        self, conversation_id: str, session: Optional[Session] = None
+    ) -> bool:
         """
         Delete conversation settings
         
@@ -108,7 +112,7 @@ class ConversationService:
         Returns:
             Whether deletion was successful
         """
-        return self.repository.delete_settings(conversation_id)
+        return self.repository.delete_settings(conversation_id, session=session)
     
     def generate_outline(
         self,
@@ -192,9 +196,10 @@ class ConversationService:
         else:
             raise Exception(result.get('error', 'Failed to generate outline'))
     
-    def _strip_think_content(self, text: str) -> str:
+    @staticmethod
+    def _strip_think_content(text: str) -> str:
         """
-        Remove think content from AI response
+        Remove think content from AI response (delegates to shared util)
         
         Args:
             text: Response text that may contain think content
@@ -202,22 +207,7 @@ class ConversationService:
         Returns:
             Text with think content removed
         """
-        import re
-        
-        # Remove <think>...</think> tags
-        text = re.sub(r'<think>.*?</think>', '', text, flags=re.DOTALL | re.IGNORECASE)
-        
-        # Remove ```think\n...\n``` code blocks
-        text = re.sub(r'```think\s*\n.*?\n```', '', text, flags=re.DOTALL | re.IGNORECASE)
-        
-        # Remove standalone ```think``` markers
-        text = re.sub(r'```think\s*```', '', text, flags=re.IGNORECASE)
-        
-        # Clean up extra whitespace
-        text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
-        text = text.strip()
-        
-        return text
+        return strip_think_content(text)
     
     def generate_outline_stream(
         self,
@@ -4,6 +4,7 @@ DeepSeek service module
 import requests
 from typing import Dict, Optional, List
 from utils.logger import get_logger
+from utils.http_session import create_http_session
 from utils.exceptions import ProviderError, ValidationError
 from config import Config
 
@@ -22,6 +23,7 @@ class DeepSeekService:
         """
         self.base_url = base_url or Config.DEEPSEEK_BASE_URL
         self.timeout = Config.DEEPSEEK_TIMEOUT
+        self.session = create_http_session()
     
     def chat_completion(
         self,
@@ -73,8 +75,8 @@ class DeepSeekService:
             payload["stop"] = stop_words
         
         try:
-            logger.info(f"Calling DeepSeek API - Model: {model}, Messages: {len(messages)}")
-            response = requests.post(
+            logger.info("Calling DeepSeek API - Model: %s, Messages: %d", model, len(messages))
+            response = self.session.post(
                 url,
                 headers=headers,
                 json=payload,
@@ -1,9 +1,12 @@
 """
 Ollama service module
 """
+import json
+import logging
 import requests
-from typing import Dict, List, Optional
+from typing import Dict, Generator, List, Optional
 from utils.logger import get_logger
+from utils.http_session import create_http_session
 from utils.exceptions import ProviderError
 from config import Config
 
@@ -22,6 +25,7 @@ class OllamaService:
         """
         self.base_url = base_url or Config.OLLAMA_BASE_URL
         self.timeout = Config.OLLAMA_TIMEOUT
+        self.session = create_http_session()
     
     def generate(
         self,
@@ -56,8 +60,8 @@ class OllamaService:
             payload["options"] = options
         
         try:
-            logger.info(f"Calling Ollama API - Model: {model}, Prompt length: {len(prompt)}")
-            response = requests.post(
+            logger.info("Calling Ollama API - Model: %s, Prompt length: %d", model, len(prompt))
+            response = self.session.post(
                 url,
                 json=payload,
                 timeout=self.timeout
@@ -66,7 +70,9 @@ class OllamaService:
             if response.status_code == 200:
                 result = response.json()
                 logger.info("Ollama API call successful")
-                logger.debug(f" - {response.text}")
+                # response.text decodes the whole body; only pay for it when DEBUG is on
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(" - %s", response.text)
                 return result
             else:
                 error_msg = f"Ollama API error: {response.status_code}"
@@ -86,6 +92,75 @@ class OllamaService:
                 status_code=503
             )
     
+    def generate_stream(
+        self,
+        model: str,
+        prompt: str,
+        options: Optional[Dict] = None
+    ) -> Generator[str, None, None]:
+        """
+        Generate text response token by token
+
+        Args:
+            model: Model name
+            prompt: Prompt text
+            options: Generation options
+
+        Yields:
+            Response text fragments as Ollama produces them
+
+        Raises:
+            ProviderError: When API call fails
+        """
+        url = f"{self.base_url}/api/generate"
+        payload = {
+            "model": model,
+            "prompt": prompt,
+            "stream": True
+        }
+
+        if options:
+            payload["options"] = options
+
+        try:
+            # Context manager releases the pooled connection even if the consumer stops early
+            with self.session.post(
+                url,
+                json=payload,
+                stream=True,
+                timeout=self.timeout
+            ) as response:
+                if response.status_code != 200:
+                    error_msg = f"Ollama API error: {response.status_code}"
+                    logger.error(f"{error_msg} - {response.text}")
+                    raise ProviderError(
+                        error_msg,
+                        provider='ollama',
+                        status_code=response.status_code
+                    )
+
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    try:
+                        data = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if 'response' in data:
+                        yield data['response']
+                    if data.get('done', False):
+                        break
+
+        except requests.exceptions.RequestException as e:
+            error_msg = f"Failed to connect to Ollama: {str(e)}"
+            logger.error(error_msg)
+            raise ProviderError(
+                error_msg,
+                provider='ollama',
+                status_code=503,
+                error_code='NETWORK_UNREACHABLE',
+            )
+
     def list_models(self) -> List[Dict]:
         """
         Get available model list
@@ -100,12 +175,12 @@ class OllamaService:
         
         try:
             logger.info("Fetching Ollama models")
-            response = requests.get(url, timeout=10)
+            response = self.session.get(url, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
                 models = data.get('models', [])
-                logger.info(f"Found {len(models)} Ollama models")
+                logger.info("Found %d Ollama models", len(models))
                 return models
             else:
                 error_msg = f"Failed to fetch models: {response.status_code}"
@@ -134,7 +209,7 @@ class OllamaService:
         """
         try:
             url = f"{self.base_url}/api/tags"
-            response = requests.get(url, timeout=5)
+            response = self.session.get(url, timeout=5)
             return response.status_code == 200
         except requests.exceptions.RequestException:
             return False
@@ -3,6 +3,7 @@ Story generation service layer
 """
 from typing import Any, List, Optional, Dict, TYPE_CHECKING, Generator, Tuple, Literal
 import json
+import sys
 from service.ai_service import AIService
 from service.ai_service_streaming import AIServiceStreaming
 from service.chat_service import ChatService
@@ -482,7 +483,6 @@ class StoryGenerationService:
             error_msg = str(e)
             logger.error(f"Error in stream: {error_msg}", exc_info=True)
             # Also print to stderr for immediate visibility in Tauri
-            import sys
             print(f"[ERROR] Error in stream: {error_msg}", file=sys.stderr, flush=True)
             yield json.dumps({"error": error_msg}) + "\n"
             return
@@ -542,7 +542,6 @@ class StoryGenerationService:
                 error_msg = str(e)
                 logger.error(f"Error saving streamed content: {error_msg}", exc_info=True)
                 # Also print to stderr for immediate visibility in Tauri
-                import sys
                 print(f"[ERROR] Error saving streamed content: {error_msg}", file=sys.stderr, flush=True)
     
     def confirm_section(
@@ -123,7 +123,9 @@ class StoryService:
         
         return progress.to_dict()
     
-    def delete_progress(self, conversation_id: str) -> bool:
+    def delete_progress(
+        self, conversation_id: str, session: Optional[Session] = None
+    ) -> bool:
         """
         Delete story progress
         
@@ -133,7 +135,7 @@ class StoryService:
         Returns:
             Whether deletion was successful
         """
-        return self.repository.delete_progress(conversation_id)
+        return self.repository.delete_progress(conversation_id, session=session)
     
     def should_generate_next_section(self, conversation_id: str) -> bool:
         """
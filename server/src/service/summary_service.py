@@ -2,6 +2,7 @@
 Conversation summary service layer
 """
 from typing import Optional, Dict, List
+from sqlalchemy.orm import Session
 from repository.summary_repository import SummaryRepository
 from service.ai_service import AIService
 from service.app_settings_service import AppSettingsService
@@ -199,7 +200,9 @@ class SummaryService:
         estimated = int(chinese_chars * 1.5 + english_words * 1.3)
         return estimated
     
-    def delete_summary(self, conversation_id: str) -> bool:
+    def delete_summary(
+        self, conversation_id: str, session: Optional[Session] = None
+    ) -> bool:
         """
         Delete conversation summary
         
@@ -209,5 +212,5 @@ class SummaryService:
         Returns:
             Whether deletion was successful
         """
-        return self.repository.delete_summary(conversation_id)
+        return self.repository.delete_summary(conversation_id, session=session)
 
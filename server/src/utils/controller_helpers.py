@@ -2,25 +2,58 @@
 Controller helper utilities
 Provides common functions for controllers
 """
-from functools import wraps
-from flask import jsonify
-from typing import Optional, Callable, Any
-from utils.i18n import get_i18n_text
+from functools import lru_cache, wraps
+import orjson
+from flask import Response, jsonify, request
+from typing import Optional, Callable, Any, Dict, Mapping
+from utils.i18n import I18n, get_i18n_text
+from utils.json_provider import accepts_msgpack
 from utils.exceptions import APIError, ValidationError, ProviderError, ServiceError
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+def request_json() -> Dict[str, Any]:
+    """
+    Parsed JSON request body, or an empty dict
+    
+    Missing, non-JSON and malformed bodies all yield {} without raising, so the
+    endpoint's own required-field checks produce the 400 response.
+    
+    Returns:
+        Request body dict
+    """
+    data = request.get_json(silent=True)
+    return data if isinstance(data, dict) else {}
+
+
+@lru_cache(maxsize=256)
+def _error_body(language: str, error_key: str, default_message: Optional[str]) -> bytes:
+    """Serialized error body; languages and keys form a small fixed set"""
+    error_msg = get_i18n_text(language, error_key, default=default_message or error_key)
+    return orjson.dumps(
+        {"success": False, "error": error_msg},
+        option=orjson.OPT_APPEND_NEWLINE,
+    )
+
+
+# Cached bodies hold translated text, so they go whenever the i18n cache does
+I18n.register_clear_hook(_error_body.cache_clear)
+
+
 def error_response(
     language: str,
     error_key: str,
     status_code: int = 400,
     default_message: Optional[str] = None
-):
+) -> Response:
     """
     Create a standardized error response
     
+    JSON bodies come from a per-(language, key) cache; clients that ask for
+    MessagePack get the same payload through the app's JSON provider.
+    
     Args:
         language: Language code ('zh' or 'en')
         error_key: Error message key (e.g., 'error_messages.conversation_id_required')
@@ -28,13 +61,20 @@ def error_response(
         default_message: Default message if key not found
     
     Returns:
-        Flask JSON response with error
+        Flask JSON (or msgpack) response with error
     """
-    error_msg = get_i18n_text(language, error_key, default=default_message or error_key)
-    return jsonify({
-        "success": False,
-        "error": error_msg
-    }), status_code
+    if accepts_msgpack():
+        error_msg = get_i18n_text(language, error_key, default=default_message or error_key)
+        response = jsonify({"success": False, "error": error_msg})
+        response.status_code = status_code
+        return response
+    response = Response(
+        _error_body(language, error_key, default_message),
+        status=status_code,
+        mimetype='application/json',
+    )
+    response.vary.add('Accept')
+    return response
 
 
 def validate_required(
@@ -42,7 +82,7 @@ def validate_required(
     value: Any,
     field_name: str,
     error_key: Optional[str] = None
-):
+) -> Optional[Response]:
     """
     Validate required field and return error response if missing
     
@@ -53,7 +93,7 @@ def validate_required(
         error_key: Optional custom error key
     
     Returns:
-        Error response tuple if validation fails, None otherwise
+        Error response if validation fails, None otherwise
     """
     if not value:
         if error_key:
@@ -65,6 +105,23 @@ def validate_required(
     return None
 
 
+def validate_required_fields(language: str, values: Mapping[str, Any]) -> Optional[Response]:
+    """
+    Validate several required fields in one pass
+    
+    Args:
+        language: Language code ('zh' or 'en')
+        values: Field name -> value, checked in order
+    
+    Returns:
+        Error response for the first missing field, None if all are present
+    """
+    for field_name, value in values.items():
+        if not value:
+            return error_response(language, f"error_messages.{field_name}_required")
+    return None
+
+
 def handle_errors(func: Callable) -> Callable:
     """
     Decorator to handle exceptions in controller methods
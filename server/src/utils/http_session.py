@@ -0,0 +1,31 @@
+"""
+Shared HTTP session factory for AI provider clients.
+Keeps TCP/TLS connections alive across calls instead of reconnecting per request.
+"""
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config import Config
+
+
+def create_http_session(pool_maxsize: Optional[int] = None) -> requests.Session:
+    """
+    Create a ``requests.Session`` with a keep-alive connection pool.
+
+    No automatic retries are mounted: chat/generate calls are non-idempotent POSTs
+    and can take minutes, so failures surface to the caller as before.
+
+    Args:
+        pool_maxsize: Max pooled connections per host (defaults to Config.HTTP_POOL_MAXSIZE).
+
+    Returns:
+        Configured session; share one per provider service singleton.
+    """
+    maxsize = pool_maxsize or Config.HTTP_POOL_MAXSIZE
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=maxsize)
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
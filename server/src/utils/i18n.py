@@ -2,7 +2,7 @@
 Internationalization (i18n) utility
 Provides localization support for error messages and user messages
 """
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple
 from utils.prompt_template_loader import PromptTemplateLoader
 
 
@@ -10,6 +10,19 @@ class I18n:
     """Internationalization helper class"""
     
     _cache: Dict[str, Dict[str, Any]] = {}
+    # Dotted key -> text for every string leaf, built once per language
+    _flat: Dict[str, Dict[str, str]] = {}
+    # Callbacks run by clear_cache, for caches other modules derive from this text
+    _clear_hooks: List[Callable[[], None]] = []
+    
+    @staticmethod
+    def _iter_leaves(node: Dict[str, Any], prefix: str = '') -> Iterator[Tuple[str, str]]:
+        for k, v in node.items():
+            path = f'{prefix}{k}'
+            if isinstance(v, dict):
+                yield from I18n._iter_leaves(v, f'{path}.')
+            elif isinstance(v, str):
+                yield path, v
     
     @classmethod
     def get_text(cls, language: str, key: str, default: Optional[str] = None) -> str:
@@ -24,10 +37,17 @@ class I18n:
         Returns:
             Localized text string
         """
-        if language not in cls._cache:
+        flat = cls._flat.get(language)
+        if flat is None:
             template = PromptTemplateLoader.get_template(language)
             cls._cache[language] = template
+            flat = cls._flat[language] = dict(cls._iter_leaves(template))
+        
+        text = flat.get(key)
+        if text is not None:
+            return text
         
+        # Missing keys and non-string values take the original walk
         template = cls._cache[language]
         keys = key.split('.')
         value = template
@@ -44,10 +64,18 @@ class I18n:
                 return cls.get_text('en', key, default=key)
             return key
     
+    @classmethod
+    def register_clear_hook(cls, hook: Callable[[], None]):
+        """Run hook whenever the i18n cache is cleared"""
+        cls._clear_hooks.append(hook)
+    
     @classmethod
     def clear_cache(cls):
-        """Clear i18n cache"""
+        """Clear i18n cache and any registered derived caches"""
         cls._cache.clear()
+        cls._flat.clear()
+        for hook in cls._clear_hooks:
+            hook()
 
 
 def get_i18n_text(language: str, key: str, default: Optional[str] = None) -> str:
@@ -0,0 +1,111 @@
+"""
+orjson-backed JSON provider for Flask
+Keeps the wire format of Flask's default provider while serializing with orjson
+"""
+from typing import Any
+
+import msgpack
+import orjson
+from flask import Response, has_request_context, request
+from flask.json.provider import DefaultJSONProvider
+
+MSGPACK_MIMETYPE = 'application/msgpack'
+
+
+def accepts_msgpack() -> bool:
+    """True when the client explicitly lists MessagePack (a bare */* does not count)"""
+    if not has_request_context():
+        return False
+    return any(
+        mimetype == MSGPACK_MIMETYPE and quality > 0
+        for mimetype, quality in request.accept_mimetypes
+    )
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider that serializes with orjson
+
+    Datetimes and dataclasses are passed through to Flask's ``default`` hook so
+    responses keep the same RFC 822 date format as ``DefaultJSONProvider``.
+    """
+
+    def _dump_options(self, sort_keys: bool, indent: bool) -> int:
+        option = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """
+        Serialize data as a JSON string
+
+        Only ``default``, ``sort_keys`` and ``indent`` are honoured; other
+        ``json.dumps`` keyword arguments have no orjson equivalent and are ignored.
+
+        Args:
+            obj: Data to serialize
+            **kwargs: Serialization overrides
+
+        Returns:
+            JSON text
+        """
+        option = self._dump_options(
+            sort_keys=kwargs.get('sort_keys', self.sort_keys),
+            indent=bool(kwargs.get('indent')),
+        )
+        return orjson.dumps(
+            obj,
+            default=kwargs.get('default', self.default),
+            option=option,
+        ).decode('utf-8')
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """
+        Deserialize JSON text or UTF-8 bytes
+
+        Backs ``request.json`` / ``request.get_json()``. ``orjson.JSONDecodeError``
+        subclasses ``ValueError``, so Flask still maps malformed bodies to 400.
+
+        Args:
+            s: JSON text or bytes
+            **kwargs: Ignored (no orjson equivalent)
+
+        Returns:
+            Decoded object
+        """
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """
+        Serialize the given arguments as a JSON response
+
+        Bytes from orjson are handed to the response directly, skipping the
+        str round-trip of the default provider. Clients that send
+        ``Accept: application/msgpack`` get the same payload as MessagePack;
+        both variants carry ``Vary: Accept`` so caches keep them apart.
+
+        Returns:
+            Flask Response with ``application/json`` (or msgpack) mimetype
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        if accepts_msgpack():
+            body = msgpack.packb(obj, default=self.default, use_bin_type=True)
+            response = self._app.response_class(body, mimetype=MSGPACK_MIMETYPE)
+            response.vary.add('Accept')
+            return response
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        body = orjson.dumps(
+            obj,
+            default=self.default,
+            option=self._dump_options(self.sort_keys, indent),
+        )
+        response = self._app.response_class(body + b"\n", mimetype=self.mimetype)
+        response.vary.add('Accept')
+        return response
@@ -1,12 +1,16 @@
 """
 Logging configuration module
 """
+import atexit
+import copy
 import logging
+import queue
 import sys
 import os
+import threading
 from pathlib import Path
-from typing import Optional
-from logging.handlers import RotatingFileHandler
+from typing import Iterable, Optional
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 from middleware.request_context import current_request_log_context
 
@@ -22,6 +26,11 @@ MAX_LOG_BACKUP_COUNT = 5
 # Maximum total size for all log files: ~50MB (5 * 10MB)
 MAX_TOTAL_LOG_SIZE = MAX_LOG_FILE_SIZE * MAX_LOG_BACKUP_COUNT
 
+# Records from every logger go through one queue to a single writer thread
+_LOG_QUEUE: queue.SimpleQueue = queue.SimpleQueue()
+_listener: Optional[QueueListener] = None
+_listener_lock = threading.Lock()
+
 
 class RequestContextFilter(logging.Filter):
     """Inject request-scoped correlation fields into each log record."""
@@ -35,6 +44,49 @@ class RequestContextFilter(logging.Filter):
         return True
 
 
+class _DeferredQueueHandler(QueueHandler):
+    """
+    Enqueue records together with the handlers that should write them.
+
+    Unlike the stdlib QueueHandler this does not format the record, so
+    tracebacks from ``exc_info=True`` are rendered on the listener thread.
+    """
+
+    def __init__(self, targets: Iterable[logging.Handler]):
+        super().__init__(_LOG_QUEUE)
+        self.targets = tuple(targets)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Resolve %-args now; exc_info stays on the record for the target handlers
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        self.queue.put_nowait((record, self.targets))
+
+
+class _DispatchQueueListener(QueueListener):
+    """Write each queued record to the handlers it was enqueued with."""
+
+    def handle(self, item) -> None:
+        record, targets = item
+        for handler in targets:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+def _ensure_listener() -> None:
+    """Start the background log writer once; it is flushed and stopped at exit."""
+    global _listener
+    with _listener_lock:
+        if _listener is None:
+            _listener = _DispatchQueueListener(_LOG_QUEUE)
+            _listener.start()
+            atexit.register(_listener.stop)
+
+
 def _get_log_dir() -> Optional[Path]:
     """
     Get the log directory path.
@@ -60,14 +112,12 @@ def _get_log_dir() -> Optional[Path]:
 
 
 def _setup_file_handler(
-    logger: logging.Logger,
     log_dir: Path,
     log_level: int,
     format_string: str,
-    context_filter: logging.Filter,
-) -> None:
+) -> logging.Handler:
     """
-    Setup rotating file handler for error logs.
+    Create the rotating file handler for error logs.
     """
     log_file = log_dir / 'python_error.log'
     
@@ -82,12 +132,10 @@ def _setup_file_handler(
     
     formatter = logging.Formatter(format_string)
     file_handler.setFormatter(formatter)
-    file_handler.addFilter(context_filter)
-    
-    logger.addHandler(file_handler)
     
     # Clean up old log files if total size exceeds limit
     _cleanup_old_logs(log_dir)
+    return file_handler
 
 
 def _cleanup_old_logs(log_dir: Path) -> None:
@@ -180,14 +228,12 @@ def setup_logger(
     # Set encoding to UTF-8 to support Chinese characters
     console_handler = logging.StreamHandler(sys.stderr)
     console_handler.setLevel(log_level_int)
-    request_context_filter = RequestContextFilter()
     
     # Set format
     formatter = logging.Formatter(
         format_string or Config.LOG_FORMAT
     )
     console_handler.setFormatter(formatter)
-    console_handler.addFilter(request_context_filter)
     
     # Ensure UTF-8 encoding for console output
     if hasattr(sys.stderr, 'reconfigure'):
@@ -196,24 +242,28 @@ def setup_logger(
         except Exception:
             pass
     
-    # Add handler
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
     
     # Setup file handler for error logs
     try:
         log_dir = _get_log_dir()
         if log_dir:
-            _setup_file_handler(
-                logger,
+            handlers.append(_setup_file_handler(
                 log_dir,
                 log_level_int,
                 format_string or Config.LOG_FORMAT,
-                request_context_filter,
-            )
+            ))
     except Exception:
         # Silently fail if file handler setup fails
         pass
     
+    # The logger only enqueues; formatting and I/O happen on the listener thread.
+    # The request-context filter runs here, where the request's contextvars are visible.
+    queue_handler = _DeferredQueueHandler(handlers)
+    queue_handler.addFilter(RequestContextFilter())
+    logger.addHandler(queue_handler)
+    _ensure_listener()
+    
     return logger
 
 
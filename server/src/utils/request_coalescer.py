@@ -0,0 +1,64 @@
+"""
+Single-flight request coalescing
+Concurrent callers with the same key share one execution instead of each hitting upstream
+"""
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class _InflightCall:
+    """Result slot shared by the leader and followers of one key"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class RequestCoalescer:
+    """Collapse concurrent identical calls into a single execution"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inflight: Dict[Hashable, _InflightCall] = {}
+
+    def run(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """
+        Run ``fn`` once per key among concurrent callers
+
+        The first caller executes ``fn``; callers arriving while it is in flight
+        block and receive the same result (or the same exception). Nothing is
+        retained once the call finishes, so sequential calls always execute.
+
+        Args:
+            key: Hashable identity of the call
+            fn: Zero-argument callable performing the work
+
+        Returns:
+            Result of ``fn``
+        """
+        with self._lock:
+            call = self._inflight.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = _InflightCall()
+                self._inflight[key] = call
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            call.done.set()
+        return call.result
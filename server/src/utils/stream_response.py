@@ -2,13 +2,86 @@
 Stream response utility module
 Provides unified stream response wrapper method
 """
-from typing import Generator, Callable, Optional, Dict, Any
-from flask import Response, stream_with_context
+from typing import Generator, Callable, Iterator, Optional, Dict, Any
+from flask import Response, copy_current_request_context, g, has_request_context, stream_with_context
 import json
+import queue
+import threading
+import time
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Frames are encoded here so Werkzeug can pass them through without a per-chunk encode
+_DONE_FRAME = b'data: ' + json.dumps({'done': True}).encode('utf-8') + b'\n\n'
+
+# Text deltas are held until this many characters or seconds have built up, then sent as one frame
+_COALESCE_MAX_CHARS = 32
+_COALESCE_MAX_DELAY = 0.02
+
+_END = object()
+_TIMEOUT = object()
+
+
+def _sse_frame(payload: str) -> bytes:
+    """Encode one SSE ``data:`` frame"""
+    return b'data: ' + payload.encode('utf-8') + b'\n\n'
+
+
+class _UpstreamReader:
+    """
+    Drain the upstream generator on a worker thread
+
+    The SSE loop can then wait for the next delta with a timeout and flush buffered
+    text while the model stalls, instead of blocking inside the upstream read.
+    """
+
+    def __init__(self, source: Iterator[str]):
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._stopped = threading.Event()
+        if has_request_context():
+            # Services and log records read request-scoped values (profile, request id) from g,
+            # which a copied request context does not carry over
+            g_values = dict(vars(g))
+
+            @copy_current_request_context
+            def target():
+                vars(g).update(g_values)
+                self._pump(source)
+        else:
+            def target():
+                self._pump(source)
+
+        threading.Thread(target=target, name='sse-upstream', daemon=True).start()
+
+    def _pump(self, source: Iterator[str]) -> None:
+        try:
+            for chunk in source:
+                if self._stopped.is_set():
+                    break
+                self._queue.put((chunk, None))
+            self._queue.put((_END, None))
+        except Exception as e:
+            self._queue.put((_END, e))
+        finally:
+            close = getattr(source, 'close', None)
+            if close:
+                close()
+
+    def get(self, timeout: Optional[float]) -> Any:
+        """Next upstream chunk, ``_TIMEOUT`` if none arrived in time, or ``_END``; re-raises upstream errors"""
+        try:
+            chunk, error = self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return _TIMEOUT
+        if error is not None:
+            raise error
+        return chunk
+
+    def stop(self) -> None:
+        """Stop reading upstream once the client has gone away"""
+        self._stopped.set()
+
 
 def create_stream_response(
     stream_generator: Generator[str, None, None],
@@ -34,8 +107,34 @@ def create_stream_response(
     def generate():
         """Generator function for streaming response"""
         accumulated_content = ""
+        # Pending text deltas not yet sent; flushed before any control frame to keep ordering
+        pending = []
+        pending_len = 0
+        # The first delta always goes out immediately
+        last_flush = float('-inf')
+        reader = _UpstreamReader(stream_generator)
+
+        def drain() -> bytes:
+            nonlocal pending_len
+            frame = _sse_frame(''.join(pending))
+            pending.clear()
+            pending_len = 0
+            return frame
+
         try:
-            for chunk in stream_generator:
+            while True:
+                # Never wait on upstream longer than the coalescing window while text is pending
+                wait = None
+                if pending:
+                    wait = max(0.0, _COALESCE_MAX_DELAY - (time.monotonic() - last_flush))
+                chunk = reader.get(wait)
+                if chunk is _TIMEOUT:
+                    yield drain()
+                    last_flush = time.monotonic()
+                    continue
+                if chunk is _END:
+                    break
+
                 # Check if chunk is an error message (JSON format)
                 chunk_str = chunk if isinstance(chunk, str) else str(chunk)
                 
@@ -43,8 +142,10 @@ def create_stream_response(
                     # Try to parse as JSON, check if it's an error message
                     error_data = json.loads(chunk_str.strip())
                     if error_data.get('error'):
+                        if pending:
+                            yield drain()
                         error_msg = json.dumps({'error': error_data.get('error')})
-                        yield f"data: {error_msg}\n\n"
+                        yield _sse_frame(error_msg)
                         
                         # Call error callback
                         if on_error and error_data.get('error'):
@@ -56,14 +157,18 @@ def create_stream_response(
                         return
                     pw = error_data.get('parse_warnings')
                     if isinstance(pw, list):
-                        yield f"data: {json.dumps({'parse_warnings': pw})}\n\n"
+                        if pending:
+                            yield drain()
+                        yield _sse_frame(json.dumps({'parse_warnings': pw}))
                         continue
                     capability_notice = error_data.get('provider_capability_notice')
                     if isinstance(capability_notice, str) and capability_notice.strip():
                         payload = json.dumps({
                             'provider_capability_notice': capability_notice
                         }, ensure_ascii=False)
-                        yield f"data: {payload}\n\n"
+                        if pending:
+                            yield drain()
+                        yield _sse_frame(payload)
                         continue
                 except (json.JSONDecodeError, ValueError, AttributeError):
                     # Chunk is plain text
@@ -81,8 +186,25 @@ def create_stream_response(
                         except Exception as e:
                             logger.warning(f"Error in on_chunk callback: {str(e)}")
                     
-                    # Send chunk as plain text
-                    yield f"data: {chunk_str}\n\n"
+                    # Clients split frames on newlines, so a delta containing one is never merged
+                    # with its neighbours; it goes out on its own as before
+                    if '\n' in chunk_str:
+                        if pending:
+                            yield drain()
+                        yield _sse_frame(chunk_str)
+                        last_flush = time.monotonic()
+                        continue
+
+                    # Send chunks as plain text, coalesced into fewer frames
+                    pending.append(chunk_str)
+                    pending_len += len(chunk_str)
+                    now = time.monotonic()
+                    if pending_len >= _COALESCE_MAX_CHARS or now - last_flush >= _COALESCE_MAX_DELAY:
+                        yield drain()
+                        last_flush = now
+
+            if pending:
+                yield drain()
             
             # Call completion callback
             if on_complete:
@@ -98,13 +220,15 @@ def create_stream_response(
             if persist_metadata:
                 err = persist_metadata.get('persist_failed')
                 if err:
-                    yield f"data: {json.dumps({'persist_failed': True, 'error': err})}\n\n"
+                    yield _sse_frame(json.dumps({'persist_failed': True, 'error': err}))
             
             # Send final message
-            yield f"data: {json.dumps({'done': True})}\n\n"
+            yield _DONE_FRAME
             
         except Exception as e:
             logger.error(f"Error in stream response: {str(e)}", exc_info=True)
+            if pending:
+                yield drain()
             
             # Call error callback
             if on_error:
@@ -115,11 +239,14 @@ def create_stream_response(
             
             # Send error message
             error_msg = json.dumps({"error": f"Server error: {str(e)}"})
-            yield f"data: {error_msg}\n\n"
+            yield _sse_frame(error_msg)
+        finally:
+            reader.stop()
     
     return Response(
         stream_with_context(generate()),
         mimetype='text/event-stream',
+        direct_passthrough=True,
         headers={
             'Cache-Control': 'no-cache',
             'X-Accel-Buffering': 'no'
@@ -3,14 +3,22 @@ Strip model "think" / reasoning blocks from assistant text before persistence or
 """
 import re
 
-# Block tags from common model families: Qwen-style redacted_thinking / thinking tags,
-# generic reasoning tags, and plain think/close-think pairs (hex escapes for angle brackets).
-_THINK_BLOCK_PATTERNS = (
-    r'<think>.*?</think>',
-    r'<thinking>.*?</thinking>',
-    r'<reasoning>.*?</reasoning>',
-    r'(?is)\x3cthink\x3e.*?\x3c/think\x3e',
+# Block tags from common model families (think, thinking, reasoning) and ```think /
+# ```thinking fences, empty or not. One alternation so the reply is scanned once;
+# arms are in the order the separate passes used to run.
+_THINK_ANY_RE = re.compile(
+    r'<think>.*?</think>'
+    r'|<thinking>.*?</thinking>'
+    r'|<reasoning>.*?</reasoning>'
+    r'|```think\s*\n.*?\n```'
+    r'|```think\s*```'
+    r'|```thinking\s*\n.*?\n```'
+    r'|```thinking\s*```',
+    re.DOTALL | re.IGNORECASE,
 )
+_MULTI_BLANK_RE = re.compile(r'\n\s*\n\s*\n+')
+# Every arm above opens with one of these; most replies contain none of them
+_THINK_MARKER_RE = re.compile(r'<think|<reasoning|```think', re.IGNORECASE)
 
 
 def strip_think_content(text: str) -> str:
@@ -23,11 +31,8 @@ def strip_think_content(text: str) -> str:
     Returns:
         Text with think blocks removed and whitespace normalized.
     """
-    for pat in _THINK_BLOCK_PATTERNS:
-        text = re.sub(pat, '', text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r'```think\s*\n.*?\n```', '', text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r'```think\s*```', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'```thinking\s*\n.*?\n```', '', text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r'```thinking\s*```', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
+    if not _THINK_MARKER_RE.search(text):
+        return _MULTI_BLANK_RE.sub('\n\n', text).strip()
+    text = _THINK_ANY_RE.sub('', text)
+    text = _MULTI_BLANK_RE.sub('\n\n', text)
     return text.strip()
@@ -100,7 +100,7 @@ class TestChatController:
                 'conversationStopWords': ['END', 'STOP'],
             }
         }
-        mock_services['chat_service'].get_conversation.return_value = []
+        mock_services['chat_service'].get_recent_messages_for_api.return_value = []
         mock_services['ai_service_streaming'].chat_stream.return_value = iter(['ok'])
 
         def _fake_stream_response(**kwargs):
@@ -128,6 +128,72 @@ class TestChatController:
         assert call_kwargs['max_tokens'] == 333
         assert call_kwargs['stop_words'] == ['END', 'STOP']
 
+    def test_chat_stream_skips_history_lookup_for_new_conversation(
+        self,
+        client,
+        mock_services,
+    ):
+        mock_services['app_settings_service'].get_language.return_value = 'en'
+        mock_services['ai_config_service'].get_config_for_api.return_value = {
+            'provider': 'deepseek',
+            'model': 'deepseek-chat',
+            'api_key': 'test-key',
+            'base_url': 'https://api.deepseek.com',
+            'max_tokens': 2048,
+            'temperature': 0.7,
+        }
+        mock_services['ai_service_streaming'].chat_stream.return_value = iter(['ok'])
+
+        def _fake_stream_response(**kwargs):
+            list(kwargs['stream_generator'])
+            return Response("data: ok\n\n", mimetype='text/event-stream')
+
+        with patch(
+            'controller.chat_controller.create_stream_response',
+            side_effect=_fake_stream_response,
+        ):
+            response = client.post(
+                '/api/chat-stream',
+                json={'provider': 'deepseek', 'message': 'hello'},
+            )
+
+        assert response.status_code == 200
+        mock_services['chat_service'].get_recent_messages_for_api.assert_not_called()
+        mock_services['conversation_service'].get_settings.assert_not_called()
+        call_kwargs = mock_services['ai_service_streaming'].chat_stream.call_args.kwargs
+        assert call_kwargs['messages'] is None
+
+    def test_chat_stream_saves_turn_in_one_call(self, client, mock_services):
+        mock_services['app_settings_service'].get_language.return_value = 'en'
+        mock_services['ai_config_service'].get_config_for_api.return_value = {
+            'provider': 'deepseek',
+            'model': 'deepseek-chat',
+            'api_key': 'test-key',
+            'base_url': 'https://api.deepseek.com',
+            'max_tokens': 2048,
+            'temperature': 0.7,
+        }
+        mock_services['conversation_service'].get_settings.return_value = None
+        mock_services['chat_service'].get_recent_messages_for_api.return_value = []
+
+        def _fake_stream_response(**kwargs):
+            kwargs['on_complete']('<think>plan</think>reply')
+            return Response("data: ok\n\n", mimetype='text/event-stream')
+
+        with patch(
+            'controller.chat_controller.create_stream_response',
+            side_effect=_fake_stream_response,
+        ):
+            client.post(
+                '/api/chat-stream',
+                json={'provider': 'deepseek', 'message': 'hello', 'conversation_id': 'conv-1'},
+            )
+
+        save = mock_services['chat_orchestration_service'].save_chat_turn
+        save.assert_called_once()
+        assert save.call_args.kwargs['reply'] == 'reply'
+        mock_services['chat_service'].save_user_message.assert_not_called()
+
     def test_chat_stream_supports_message_parts_payload(
         self,
         client,
@@ -143,7 +209,7 @@ class TestChatController:
             'temperature': 0.7,
         }
         mock_services['conversation_service'].get_settings.return_value = None
-        mock_services['chat_service'].get_conversation.return_value = []
+        mock_services['chat_service'].get_recent_messages_for_api.return_value = []
         mock_services['ai_service_streaming'].chat_stream.return_value = iter(['ok'])
 
         def _fake_stream_response(**kwargs):
@@ -228,7 +294,7 @@ class TestChatController:
             'temperature': 0.7,
         }
         mock_services['conversation_service'].get_settings.return_value = None
-        mock_services['chat_service'].get_conversation.return_value = []
+        mock_services['chat_service'].get_recent_messages_for_api.return_value = []
         mock_services['ai_service_streaming'].chat_stream.return_value = iter(['ok'])
 
         response = client.post(
@@ -424,3 +490,96 @@ class TestChatController:
         )
         assert bad_integrity.status_code == 400
         assert bad_integrity.get_json()['code'] == 'BUNDLE_ERR_INTEGRITY_FAILED'
+
+    def test_rewrite_section_validates_required_fields_in_order(self, client, mock_services):
+        mock_services['app_settings_service'].get_language.return_value = 'en'
+
+        missing_feedback = client.post(
+            '/api/story/rewrite',
+            json={'conversation_id': 'conv-1', 'provider': 'deepseek'},
+        )
+        assert missing_feedback.status_code == 400
+        assert missing_feedback.get_json()['error'] == 'feedback is required'
+
+        mock_services['story_generation_service'].rewrite_section.return_value = {'success': True}
+        ok = client.post(
+            '/api/story/rewrite',
+            json={
+                'conversation_id': 'conv-1',
+                'provider': 'deepseek',
+                'feedback': 'shorter',
+                'feedback_operation': 'bogus',
+            },
+        )
+        assert ok.status_code == 200
+        mock_services['story_generation_service'].rewrite_section.assert_called_once_with(
+            conversation_id='conv-1',
+            feedback='shorter',
+            provider='deepseek',
+            model=None,
+            feedback_operation=None,
+        )
+
+    def test_confirm_section_unexpected_error_returns_500(self, client, mock_services):
+        mock_services['story_generation_service'].confirm_section.side_effect = RuntimeError('boom')
+
+        response = client.post(
+            '/api/story/confirm',
+            json={'conversation_id': 'conv-1', 'provider': 'deepseek'},
+        )
+
+        assert response.status_code == 500
+        assert response.get_json() == {'success': False, 'error': 'Server error: boom'}
+
+    def test_save_summary_reports_first_missing_field(self, client, mock_services):
+        mock_services['app_settings_service'].get_language.return_value = 'en'
+
+        response = client.post('/api/conversation/summary', json={'summary': 'short'})
+
+        assert response.status_code == 400
+        assert response.get_json() == {'success': False, 'error': 'conversation_id is required'}
+        mock_services['summary_service'].create_or_update_summary.assert_not_called()
+
+    def test_delete_last_message_bodies(self, client, mock_services):
+        orchestration = mock_services['chat_orchestration_service']
+        orchestration.delete_last_message.return_value = {'id': 1, 'role': 'user', 'content': 'hi'}
+
+        ok = client.post('/api/conversation/delete-last-message', json={'conversation_id': 'conv-1'})
+        assert ok.status_code == 200
+        assert ok.get_json() == {'success': True, 'message': 'Last message deleted successfully'}
+
+        orchestration.delete_last_message.return_value = None
+        missing = client.post('/api/conversation/delete-last-message', json={'conversation_id': 'conv-1'})
+        assert missing.status_code == 404
+        assert missing.mimetype == 'application/json'
+        assert missing.get_json() == {'success': False, 'error': 'No message found to delete'}
+
+    def test_delete_last_message_rejects_impossible_ids_without_service_call(self, client, mock_services):
+        for bad_id in (['conv-1'], 'x' * 500):
+            response = client.post(
+                '/api/conversation/delete-last-message',
+                json={'conversation_id': bad_id},
+            )
+            assert response.status_code == 404
+        mock_services['chat_orchestration_service'].delete_last_message.assert_not_called()
+
+    def test_delete_last_message_truncates_error_detail(self, client, mock_services):
+        mock_services['chat_orchestration_service'].delete_last_message.side_effect = RuntimeError('x' * 5000)
+
+        response = client.post('/api/conversation/delete-last-message', json={'conversation_id': 'conv-1'})
+
+        assert response.status_code == 500
+        error = response.get_json()['error']
+        assert error == 'Failed to delete last message: ' + 'x' * 512
+
+    def test_malformed_json_body_is_treated_as_empty(self, client, mock_services):
+        mock_services['app_settings_service'].get_language.return_value = 'en'
+
+        response = client.post(
+            '/api/conversation/summary',
+            data='{not json',
+            content_type='application/json',
+        )
+
+        assert response.status_code == 400
+        assert response.get_json()['error'] == 'conversation_id is required'
@@ -159,3 +159,50 @@ def test_stop_endpoint_accepts_matching_instance_id_when_server_instance_exists(
     assert result.returncode == 0
     assert "200" in result.stdout
     assert "True" in result.stdout
+
+
+def test_index_and_error_handlers_keep_payloads_and_negotiate() -> None:
+    result = _run_app_snippet(
+        {
+            "FLASK_ENV": "testing",
+            "FLASK_API_TOKEN": "unit-token",
+        },
+        "client = app_module.app.test_client(); "
+        "index = client.get('/'); "
+        "missing = client.get('/api/missing', headers={'Authorization': 'Bearer unit-token'}); "
+        "print(index.status_code, index.mimetype, index.get_json()['status']); "
+        "print(missing.status_code, missing.get_json()); "
+        "packed = client.get('/', headers={'Accept': 'application/msgpack'}); "
+        "print('packed', packed.mimetype, 'Accept' in index.vary)",
+    )
+    assert result.returncode == 0, result.stderr
+    assert "200 application/json running" in result.stdout
+    assert "404 {'success': False, 'error': 'Endpoint not found'}" in result.stdout
+    assert "packed application/msgpack True" in result.stdout
+
+
+def test_shutdown_drain_gives_up_on_long_running_requests() -> None:
+    result = _run_app_snippet(
+        {
+            "FLASK_ENV": "testing",
+            "FLASK_API_TOKEN": "unit-token",
+        },
+        "import threading, time; "
+        "release = threading.Event(); "
+        "server = type('_StubServer', (), {"
+        "'process_request_thread': lambda self, request, addr: release.wait(10)"
+        "})(); "
+        "snapshot = app_module._track_handler_threads(server); "
+        "threading.Thread(target=server.process_request_thread, args=(None, None), daemon=True).start(); "
+        "time.sleep(0.05); "
+        "print('tracked', len(snapshot())); "
+        "start = time.monotonic(); "
+        "app_module._drain_handler_threads(snapshot, 0.2); "
+        "print('bounded', time.monotonic() - start < 2); "
+        "release.set(); time.sleep(0.05); "
+        "print('finished', len(snapshot()))",
+    )
+    assert result.returncode == 0, result.stderr
+    assert "tracked 1" in result.stdout
+    assert "bounded True" in result.stdout
+    assert "finished 0" in result.stdout
@@ -60,3 +60,18 @@ def test_anthropic_provider_uses_chat_anthropic() -> None:
         assert kwargs["model"] == "claude-3-5-sonnet-latest"
         assert kwargs["api_key"] == "sk-anthropic"
 
+
+@patch("langchain_ollama.ChatOllama")
+def test_chat_models_are_reused_across_requests(mock_cls: MagicMock) -> None:
+    from infrastructure.langchain_chat import _shared_chat_model
+
+    _shared_chat_model.cache_clear()
+    mock_cls.side_effect = lambda **kwargs: MagicMock(name="chat")
+    args = ("ollama", "llama3", None, None, 512, 0.2, "http://ollama:11434")
+    try:
+        first = _shared_chat_model(*args)
+        assert _shared_chat_model(*args) is first
+        assert _shared_chat_model("ollama", "llama3", None, None, 512, 0.9, "http://ollama:11434") is not first
+        assert mock_cls.call_count == 2
+    finally:
+        _shared_chat_model.cache_clear()
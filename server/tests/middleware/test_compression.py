@@ -0,0 +1,65 @@
+import gzip
+import json
+
+from flask import Flask, Response, jsonify
+
+from middleware.compression import register_compression
+
+LARGE_PAYLOAD = {"response": "word " * 1000}
+
+
+def _build_app() -> Flask:
+    app = Flask(__name__)
+    app.config["TESTING"] = True
+    register_compression(app)
+
+    @app.route("/api/large")
+    def large():
+        return jsonify(LARGE_PAYLOAD)
+
+    @app.route("/api/small")
+    def small():
+        return jsonify({"ok": True})
+
+    @app.route("/api/stream")
+    def stream():
+        return Response(iter(["data: x\n\n"] * 500), mimetype="application/json")
+
+    return app
+
+
+def _get(client, path, remote_addr="10.0.0.5", encoding="gzip, br"):
+    return client.get(
+        path,
+        headers={"Accept-Encoding": encoding},
+        environ_base={"REMOTE_ADDR": remote_addr},
+    )
+
+
+def test_large_json_is_gzipped_for_remote_clients():
+    response = _get(_build_app().test_client(), "/api/large")
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert json.loads(gzip.decompress(response.data)) == LARGE_PAYLOAD
+
+
+def test_loopback_small_streamed_and_unsupported_are_left_alone():
+    client = _build_app().test_client()
+
+    assert "Content-Encoding" not in _get(client, "/api/large", remote_addr="127.0.0.1").headers
+    assert "Content-Encoding" not in _get(client, "/api/large", encoding="identity").headers
+    assert "Content-Encoding" not in _get(client, "/api/small").headers
+    assert "Content-Encoding" not in _get(client, "/api/stream").headers
+
+
+def test_uncompressed_json_still_varies_on_accept_encoding():
+    client = _build_app().test_client()
+
+    for response in (
+        _get(client, "/api/small"),
+        _get(client, "/api/large", remote_addr="127.0.0.1"),
+        _get(client, "/api/large", encoding="identity"),
+    ):
+        assert "Content-Encoding" not in response.headers
+        assert "Accept-Encoding" in response.headers["Vary"]
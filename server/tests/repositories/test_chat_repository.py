@@ -0,0 +1,50 @@
+"""
+Unit tests for ChatRepository
+"""
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'src'))
+
+from model.chat_record import ChatRecord
+from repository.chat_repository import ChatRepository
+from repository.session_context import repository_session
+
+
+class TestChatRepository:
+    """Test ChatRepository"""
+
+    def test_get_recent_messages_returns_latest_oldest_first(self, injector):
+        """Only the newest rows are fetched, in chronological order"""
+        repo = injector.get(ChatRepository)
+        for i in range(5):
+            repo.save_message(conversation_id='recent_conv', role='user', content=f'm{i}')
+        repo.save_message(conversation_id='other_conv', role='user', content='x')
+
+        recent = repo.get_recent_messages('recent_conv', limit=3)
+
+        assert [record.content for record in recent] == ['m2', 'm3', 'm4']
+
+    def test_get_recent_messages_with_fewer_rows_than_limit(self, injector):
+        repo = injector.get(ChatRepository)
+        repo.save_message(conversation_id='short_conv', role='user', content='only')
+
+        assert [r.content for r in repo.get_recent_messages('short_conv', limit=10)] == ['only']
+
+    def test_get_all_conversations_pages_most_recent_first(self, injector):
+        repo = injector.get(ChatRepository)
+        # (conversation, minute of the message); page_a is active both first and last
+        for conversation_id, minute in (('page_c', 2), ('page_a', 1), ('page_b', 3), ('page_a', 4), ('page_d', 3)):
+            record = repo.save_message(conversation_id=conversation_id, role='user', content='x')
+            with repository_session(repo._session_factory, None) as sess:
+                sess.query(ChatRecord).filter(ChatRecord.id == record.id).update(
+                    {ChatRecord.created_at: datetime(2025, 1, 1, 0, minute)}
+                )
+
+        assert sorted(repo.get_all_conversations()) == ['page_a', 'page_b', 'page_c', 'page_d']
+        # page_b and page_d tie on their latest message and fall back to id order
+        assert repo.get_all_conversations(limit=3) == ['page_a', 'page_b', 'page_d']
+        assert repo.get_all_conversations(limit=3, offset=3) == ['page_c']
+        assert repo.get_conversation_count() == 4
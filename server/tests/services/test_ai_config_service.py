@@ -0,0 +1,63 @@
+"""
+Unit tests for AIConfigService
+"""
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'src'))
+
+from service.ai_config_service import AIConfigService
+from repository.ai_config_repository import AIConfigRepository
+
+
+class TestAIConfigService:
+    """Test AIConfigService"""
+
+    @pytest.fixture
+    def mock_repo(self):
+        repo = Mock(spec=AIConfigRepository)
+        stored = Mock()
+        stored.to_dict.return_value = {
+            'model': 'deepseek-chat',
+            'api_key': 'sk-test',
+            'base_url': 'https://api.deepseek.com',
+            'max_tokens': 4096,
+            'temperature': 0.5,
+        }
+        repo.get_config.return_value = stored
+        repo.create_or_update_config.return_value = stored
+        return repo
+
+    @pytest.fixture
+    def service(self, mock_repo):
+        return AIConfigService(mock_repo)
+
+    def test_get_config_for_api_reads_repository_once(self, service, mock_repo):
+        first = service.get_config_for_api('deepseek')
+        second = service.get_config_for_api('deepseek', model='deepseek-reasoner')
+
+        assert first['api_key'] == 'sk-test'
+        assert first['model'] == 'deepseek-chat'
+        assert second['model'] == 'deepseek-reasoner'
+        assert second['max_tokens'] == 4096
+        mock_repo.get_config.assert_called_once_with('deepseek', include_api_key=True)
+
+    def test_get_config_for_api_caches_missing_config(self, service, mock_repo):
+        mock_repo.get_config.return_value = None
+
+        service.get_config_for_api('deepseek')
+        result = service.get_config_for_api('deepseek')
+
+        assert result['api_key'] == ''
+        mock_repo.get_config.assert_called_once()
+
+    def test_create_or_update_config_invalidates_cache(self, service, mock_repo):
+        service.get_config_for_api('deepseek')
+        service.create_or_update_config(provider='deepseek', api_key='sk-new')
+        service.get_config_for_api('deepseek')
+
+        assert mock_repo.get_config.call_count == 2
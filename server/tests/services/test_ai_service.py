@@ -120,4 +120,40 @@ class TestAIService:
         
         assert result['status'] == 'healthy'
 
+    def test_chat_caches_deterministic_responses(self, service, mock_deepseek_service):
+        """Temperature 0 calls are served from cache; sampled calls always go upstream"""
+        kwargs = dict(
+            provider='deepseek',
+            message='Test message',
+            model='deepseek-chat',
+            api_key='test_key',
+        )
+
+        first = service.chat(temperature=0, **kwargs)
+        first['annotated'] = True
+        second = service.chat(temperature=0, **kwargs)
+        assert second['response'] == 'DeepSeek response'
+        assert 'annotated' not in second
+        assert mock_deepseek_service.chat_completion.call_count == 1
 
+        service.chat(temperature=0.7, **kwargs)
+        service.chat(temperature=0.7, **kwargs)
+        assert mock_deepseek_service.chat_completion.call_count == 3
+
+    def test_get_models_reuses_cached_list(self, service, mock_ollama_service):
+        """Model list is fetched from Ollama once per TTL window"""
+        mock_ollama_service.list_models = Mock(return_value=[{'name': 'llama2'}])
+
+        first = service.get_models(provider='ollama')
+        second = service.get_models(provider='ollama')
+
+        assert first == second == {'success': True, 'models': [{'name': 'llama2'}]}
+        mock_ollama_service.list_models.assert_called_once()
+
+    def test_health_check_reuses_recent_probe(self, service, mock_ollama_service):
+        """Back-to-back health checks probe Ollama once"""
+        mock_ollama_service.health_check = Mock(return_value=False)
+
+        assert service.health_check('ollama')['status'] == 'unhealthy'
+        assert service.health_check('ollama')['status'] == 'unhealthy'
+        mock_ollama_service.health_check.assert_called_once()
@@ -0,0 +1,54 @@
+"""
+Unit tests for AIServiceStreaming's direct DeepSeek stream
+"""
+import json
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'src'))
+
+from service.ai_service_streaming import AIServiceStreaming
+from utils.exceptions import ProviderError
+
+
+def _streaming_response(status_code, lines):
+    response = MagicMock(status_code=status_code, text='')
+    response.__enter__.return_value = response
+    response.iter_lines.return_value = iter(lines)
+    return response
+
+
+def _delta(content):
+    return b'data: ' + json.dumps({'choices': [{'delta': {'content': content}}]}).encode()
+
+
+def test_deepseek_stream_uses_pooled_session_and_releases_response():
+    deepseek_service = MagicMock(base_url='https://api.deepseek.test', timeout=30)
+    response = _streaming_response(200, [_delta('Hel'), b'', _delta('lo'), b'data: [DONE]'])
+    deepseek_service.session.post.return_value = response
+    service = AIServiceStreaming(ollama_service=MagicMock(), deepseek_service=deepseek_service)
+
+    chunks = list(service._chat_stream_deepseek(
+        'hi', 'deepseek-chat', 'key', None, 64, 0.5,
+    ))
+
+    assert chunks == ['Hel', 'lo']
+    call = deepseek_service.session.post.call_args
+    assert call.args[0] == 'https://api.deepseek.test/chat/completions'
+    assert call.kwargs['stream'] is True
+    response.__exit__.assert_called_once()
+
+
+def test_deepseek_stream_keeps_upstream_error_status():
+    deepseek_service = MagicMock(base_url='https://api.deepseek.test', timeout=30)
+    deepseek_service.session.post.return_value = _streaming_response(429, [])
+    service = AIServiceStreaming(ollama_service=MagicMock(), deepseek_service=deepseek_service)
+
+    with pytest.raises(ProviderError) as exc_info:
+        list(service._chat_stream_deepseek('hi', 'deepseek-chat', 'key', None, 64, 0.5))
+
+    assert exc_info.value.status_code == 429
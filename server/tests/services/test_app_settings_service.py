@@ -58,5 +58,11 @@ class TestAppSettingsService:
         """Test setting invalid language"""
         with pytest.raises(ValueError, match="Invalid language: invalid. Must be 'zh' or 'en'"):
             service.set_language('invalid')
-
-
+    
+    def test_get_language_reads_repository_once_within_ttl(self, service, mock_repo):
+        """Repeated lookups inside the TTL window are served from the cache"""
+        mock_repo.get_value.return_value = 'en'
+        
+        assert [service.get_language() for _ in range(5)] == ['en'] * 5
+        
+        mock_repo.get_value.assert_called_once_with('language', 'zh')
@@ -75,6 +75,9 @@ def orchestration(
         mock_chat_service,
         mock_ai_config_service,
         mock_conversation_service,
+        Mock(),
+        Mock(),
+        Mock(),
     )
 
 
@@ -168,3 +171,56 @@ def test_process_chat_applies_conversation_overrides(
     assert chat_kwargs['stop_words'] == ['END', 'STOP']
     mock_ai_config_service.get_config_for_api.assert_called_once()
 
+
+def test_delete_conversation_cascade_shares_one_transaction(
+    patch_uow, orchestration, mock_chat_service, mock_conversation_service
+):
+    mock_uow, mock_sess = patch_uow
+    mock_chat_service.delete_conversation.return_value = True
+    mock_conversation_service.delete_settings.return_value = True
+    orchestration.summary_service.delete_summary.return_value = False
+    orchestration.character_service.delete_conversation_characters.return_value = 3
+    orchestration.story_service.delete_progress.return_value = True
+
+    result = orchestration.delete_conversation_cascade('conv-4')
+
+    assert result == {
+        'messages': True,
+        'settings': True,
+        'summary': False,
+        'characters': 3,
+        'progress': True,
+    }
+    mock_uow.assert_called_once()
+    for method in (
+        mock_chat_service.delete_conversation,
+        mock_conversation_service.delete_settings,
+        orchestration.summary_service.delete_summary,
+        orchestration.character_service.delete_conversation_characters,
+        orchestration.story_service.delete_progress,
+    ):
+        method.assert_called_once_with('conv-4', session=mock_sess)
+
+
+def test_delete_last_message_reverts_characters_in_same_transaction(
+    patch_uow, orchestration, mock_chat_service
+):
+    mock_uow, mock_sess = patch_uow
+    mock_chat_service.delete_last_message.return_value = {
+        'id': 7,
+        'role': 'assistant',
+        'content': 'story text',
+    }
+
+    result = orchestration.delete_last_message('conv-5')
+
+    assert result['id'] == 7
+    mock_uow.assert_called_once()
+    mock_chat_service.delete_last_message.assert_called_once_with('conv-5', session=mock_sess)
+    orchestration.character_service.handle_message_deletion.assert_called_once_with(
+        conversation_id='conv-5',
+        message_id=7,
+        message_content='story text',
+        message_role='assistant',
+        session=mock_sess,
+    )
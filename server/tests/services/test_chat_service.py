@@ -101,6 +101,27 @@ class TestChatService:
         assert result[0]['role'] == 'user'
         assert result[1]['role'] == 'assistant'
     
+    def test_get_recent_messages_for_api(self, service, mock_repo):
+        """Recent history comes back in provider shape, with parts only for attachments"""
+        plain = Mock(spec=ChatRecord, id=1, role='user', content='hi', attachment_ref=None)
+        with_file = Mock(
+            spec=ChatRecord,
+            id=2,
+            role='user',
+            content='see file',
+            attachment_ref='[{"name": "a.txt", "mime_type": "text/plain"}]',
+        )
+        mock_repo.get_recent_messages.return_value = [plain, with_file]
+        
+        result = service.get_recent_messages_for_api('test_conv_001', limit=10)
+        
+        assert result[0] == {'role': 'user', 'content': 'hi', 'parts': None}
+        assert result[1]['parts'][0] == {'type': 'text', 'content': 'see file'}
+        assert result[1]['parts'][1]['name'] == 'a.txt'
+        mock_repo.get_recent_messages.assert_called_once_with(
+            conversation_id='test_conv_001', limit=10
+        )
+    
     def test_delete_last_message(self, service, mock_repo):
         """Test deleting last message"""
         # Create a mock ChatRecord object
@@ -115,7 +136,7 @@ class TestChatService:
         result = service.delete_last_message('test_conv_001')
         
         assert result == mock_message.to_dict.return_value
-        mock_repo.delete_last_message.assert_called_once_with('test_conv_001')
+        mock_repo.delete_last_message.assert_called_once_with('test_conv_001', session=None)
         mock_message.to_dict.assert_called_once()
 
     def test_get_assistant_variants(self, service, mock_repo):
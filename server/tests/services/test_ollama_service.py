@@ -0,0 +1,52 @@
+"""
+Unit tests for OllamaService streaming
+"""
+import json
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'src'))
+
+from service.ollama_service import OllamaService
+from utils.exceptions import ProviderError
+
+
+def _streaming_response(status_code, lines):
+    response = MagicMock(status_code=status_code, text='')
+    response.__enter__.return_value = response
+    response.iter_lines.return_value = iter(lines)
+    return response
+
+
+def test_generate_stream_yields_tokens_until_done():
+    service = OllamaService(base_url='http://ollama.test')
+    lines = [
+        json.dumps({'response': 'Hel', 'done': False}).encode(),
+        b'',
+        b'not-json',
+        json.dumps({'response': 'lo', 'done': True}).encode(),
+        json.dumps({'response': 'ignored'}).encode(),
+    ]
+    response = _streaming_response(200, lines)
+    service.session = MagicMock()
+    service.session.post.return_value = response
+
+    assert list(service.generate_stream(model='llama2', prompt='hi')) == ['Hel', 'lo']
+    call_kwargs = service.session.post.call_args.kwargs
+    assert call_kwargs['stream'] is True
+    assert call_kwargs['json']['stream'] is True
+    response.__exit__.assert_called_once()
+
+
+def test_generate_stream_raises_provider_error_on_http_error():
+    service = OllamaService(base_url='http://ollama.test')
+    service.session = MagicMock()
+    service.session.post.return_value = _streaming_response(500, [])
+
+    with pytest.raises(ProviderError) as exc_info:
+        list(service.generate_stream(model='llama2', prompt='hi'))
+    assert exc_info.value.status_code == 500
@@ -0,0 +1,28 @@
+"""Tests for the shared provider HTTP session."""
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'src'))
+
+from service.ollama_service import OllamaService
+from utils.http_session import create_http_session
+
+
+def test_session_mounts_pooled_adapter_for_both_schemes():
+    session = create_http_session(pool_maxsize=7)
+    http_adapter = session.get_adapter('http://localhost:11434')
+    https_adapter = session.get_adapter('https://api.deepseek.com')
+    assert http_adapter is https_adapter
+    assert http_adapter._pool_maxsize == 7
+
+
+def test_ollama_service_reuses_one_session_across_calls():
+    service = OllamaService(base_url='http://ollama.test')
+    response = Mock(status_code=200)
+    response.json.return_value = {'models': [{'name': 'llama2'}]}
+    service.session = Mock(get=Mock(return_value=response))
+
+    assert service.list_models() == [{'name': 'llama2'}]
+    assert service.health_check() is True
+    assert service.session.get.call_count == 2
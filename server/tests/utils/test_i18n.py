@@ -0,0 +1,44 @@
+"""Tests for i18n text lookup."""
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'src'))
+
+from utils.i18n import I18n, get_i18n_text
+
+_TEMPLATES = {
+    'en': {'error_messages': {'provider_required': 'provider is required'}, 'count': 3},
+    'zh': {'error_messages': {}},
+}
+
+
+def test_lookup_loads_each_template_once_and_falls_back():
+    I18n.clear_cache()
+    try:
+        with patch('utils.i18n.PromptTemplateLoader.get_template', side_effect=_TEMPLATES.get) as loader:
+            assert get_i18n_text('en', 'error_messages.provider_required') == 'provider is required'
+            assert get_i18n_text('en', 'error_messages.provider_required') == 'provider is required'
+            assert get_i18n_text('en', 'count') == '3'
+            assert get_i18n_text('en', 'missing.key', default='fallback') == 'fallback'
+            assert get_i18n_text('en', 'missing.key') == 'missing.key'
+            # Missing in zh falls back to the English text
+            assert get_i18n_text('zh', 'error_messages.provider_required') == 'provider is required'
+        assert loader.call_count == 2
+    finally:
+        I18n.clear_cache()
+
+
+def test_clear_cache_resets_cached_error_bodies():
+    from utils.controller_helpers import _error_body
+
+    I18n.clear_cache()
+    try:
+        with patch('utils.i18n.PromptTemplateLoader.get_template', side_effect=_TEMPLATES.get):
+            assert b'provider is required' in _error_body('en', 'error_messages.provider_required', None)
+        I18n.clear_cache()
+        renamed = {'en': {'error_messages': {'provider_required': 'pick a provider'}}}
+        with patch('utils.i18n.PromptTemplateLoader.get_template', side_effect=renamed.get):
+            assert b'pick a provider' in _error_body('en', 'error_messages.provider_required', None)
+    finally:
+        I18n.clear_cache()
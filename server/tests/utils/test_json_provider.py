@@ -0,0 +1,116 @@
+"""Tests for the orjson-backed Flask JSON provider."""
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+from flask import Flask, jsonify, request
+from flask.json.provider import DefaultJSONProvider
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'src'))
+
+from utils.json_provider import OrjsonProvider
+
+
+def _make_app(debug: bool = False) -> Flask:
+    app = Flask(__name__)
+    app.debug = debug
+    app.json = OrjsonProvider(app)
+    return app
+
+
+def test_response_matches_default_provider_wire_format():
+    app = _make_app()
+    payload = {
+        "success": True,
+        "name": "故事",
+        "created_at": datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        "counts": {2: "b", 1: "a"},
+    }
+    with app.app_context():
+        body = jsonify(payload).get_data()
+
+    reference = DefaultJSONProvider(app)
+    assert app.json.loads(body) == reference.loads(
+        reference.dumps(payload, sort_keys=False)
+    )
+    assert body.endswith(b"\n")
+    assert b'"created_at":"Thu, 02 Jan 2025 03:04:05 GMT"' in body
+
+
+def test_response_is_indented_in_debug_mode():
+    app = _make_app(debug=True)
+    with app.app_context():
+        body = jsonify({"success": True}).get_data(as_text=True)
+    assert body == '{\n  "success": true\n}\n'
+
+
+def test_dict_return_and_status_code_use_provider():
+    app = _make_app()
+
+    @app.route('/missing')
+    def missing():
+        return {"success": False, "error": "Endpoint not found"}, 404
+
+    resp = app.test_client().get('/missing')
+    assert resp.status_code == 404
+    assert resp.mimetype == 'application/json'
+    assert resp.get_json() == {"success": False, "error": "Endpoint not found"}
+
+
+def test_request_json_is_parsed_by_provider():
+    app = _make_app()
+
+    @app.route('/echo', methods=['POST'])
+    def echo():
+        return {"message": (request.json or {}).get("message")}
+
+    client = app.test_client()
+    ok = client.post('/echo', json={"message": "你好"})
+    assert ok.get_json() == {"message": "你好"}
+
+    bad = client.post('/echo', data=b'{"message": ', content_type='application/json')
+    assert bad.status_code == 400
+
+
+def test_response_negotiates_msgpack_when_explicitly_accepted():
+    import msgpack
+
+    app = _make_app()
+    payload = {"success": True, "response": "故事"}
+
+    @app.route("/data")
+    def data():
+        return jsonify(payload)
+
+    client = app.test_client()
+    packed = client.get("/data", headers={"Accept": "application/msgpack"})
+    assert packed.mimetype == "application/msgpack"
+    assert msgpack.unpackb(packed.data) == payload
+    assert "Accept" in packed.vary
+
+    plain = client.get("/data", headers={"Accept": "*/*"})
+    assert plain.mimetype == "application/json"
+    assert "Accept" in plain.vary
+
+
+def test_error_response_negotiates_msgpack():
+    import msgpack
+    from utils.controller_helpers import error_response
+
+    app = _make_app()
+
+    @app.route("/fail")
+    def fail():
+        return error_response("en", "error_messages.provider_required", default_message="provider is required")
+
+    client = app.test_client()
+    packed = client.get("/fail", headers={"Accept": "application/msgpack"})
+    assert packed.status_code == 400
+    assert packed.mimetype == "application/msgpack"
+    assert msgpack.unpackb(packed.data)["success"] is False
+
+    plain = client.get("/fail")
+    assert plain.status_code == 400
+    assert plain.mimetype == "application/json"
+    assert plain.json["success"] is False
+    assert "Accept" in plain.vary
@@ -0,0 +1,47 @@
+"""
+Tests for the queued logger setup.
+"""
+import logging
+import sys
+import threading
+import uuid
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'src'))
+
+from utils.logger import setup_logger
+
+
+class _CaptureHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.done = threading.Event()
+        self.text = None
+        self.thread = None
+
+    def emit(self, record):
+        self.text = self.format(record)
+        self.thread = threading.current_thread()
+        self.done.set()
+
+
+def test_error_with_traceback_is_written_on_listener_thread():
+    logger = setup_logger(
+        f'logger-test-{uuid.uuid4().hex}',
+        level='INFO',
+        format_string='%(request_id)s %(message)s',
+    )
+    capture = _CaptureHandler()
+    capture.setFormatter(logging.Formatter('%(request_id)s %(message)s'))
+    logger.handlers[0].targets = (capture,)
+
+    try:
+        raise RuntimeError('boom')
+    except RuntimeError:
+        logger.error('failed %s', 'op', exc_info=True)
+
+    assert capture.done.wait(2)
+    assert capture.thread is not threading.current_thread()
+    assert capture.text.startswith('- failed op')
+    assert 'RuntimeError: boom' in capture.text
@@ -0,0 +1,74 @@
+"""Tests for single-flight request coalescing."""
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'src'))
+
+from utils.request_coalescer import RequestCoalescer
+
+
+def _run_concurrently(coalescer, key, fn, callers=4):
+    results = []
+    errors = []
+
+    def worker():
+        try:
+            results.append(coalescer.run(key, fn))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    return results, errors
+
+
+def test_concurrent_callers_share_one_execution():
+    coalescer = RequestCoalescer()
+    release = threading.Event()
+    calls = []
+
+    def slow_call():
+        calls.append(1)
+        release.wait(timeout=5)
+        return {'response': 'ok'}
+
+    timer = threading.Timer(0.2, release.set)
+    timer.start()
+    results, errors = _run_concurrently(coalescer, 'k', slow_call)
+
+    assert errors == []
+    assert len(calls) == 1
+    assert results == [{'response': 'ok'}] * 4
+
+
+def test_followers_receive_leader_exception():
+    coalescer = RequestCoalescer()
+    release = threading.Event()
+
+    def failing_call():
+        release.wait(timeout=5)
+        raise ValueError('upstream down')
+
+    timer = threading.Timer(0.2, release.set)
+    timer.start()
+    results, errors = _run_concurrently(coalescer, 'k', failing_call, callers=3)
+
+    assert results == []
+    assert len(errors) == 3
+    assert all(isinstance(e, ValueError) for e in errors)
+
+
+def test_sequential_calls_are_not_cached():
+    coalescer = RequestCoalescer()
+    counter = iter(range(10))
+
+    assert coalescer.run('k', lambda: next(counter)) == 0
+    assert coalescer.run('k', lambda: next(counter)) == 1
+    with pytest.raises(StopIteration):
+        coalescer.run('other', lambda: next(iter(())))
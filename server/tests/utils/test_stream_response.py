@@ -82,3 +82,66 @@ def test_parse_warnings_frame_before_done():
     done_idx = next(i for i, p in enumerate(payloads) if p.get("done"))
     assert pw_idx < done_idx
 
+
+def _data_lines(body: str) -> list:
+    return [ln[6:] for ln in body.split("\n") if ln.startswith("data: ")]
+
+
+def test_text_deltas_are_coalesced_into_fewer_frames():
+    def gen():
+        for token in ["Hel", "lo", " wor", "ld"]:
+            yield token
+
+    with _app.test_request_context():
+        resp = create_stream_response(stream_generator=gen())
+        body = _collect_sse_body(resp)
+
+    lines = _data_lines(body)
+    text = [ln for ln in lines if not ln.startswith("{")]
+    assert "".join(text) == "Hello world"
+    assert len(text) < 4
+    assert json.loads(lines[-1]) == {"done": True}
+
+
+def test_newline_delta_is_sent_alone_and_order_is_kept():
+    def gen():
+        yield "first"
+        yield "line\nnext"
+        yield "tail"
+        yield json.dumps({"parse_warnings": ["w"]}) + "\n"
+        yield "after"
+
+    with _app.test_request_context():
+        resp = create_stream_response(stream_generator=gen())
+        body = _collect_sse_body(resp)
+
+    frames = [f for f in body.split("\n\n") if f]
+    assert frames == [
+        "data: first",
+        "data: line\nnext",
+        "data: tail",
+        'data: {"parse_warnings": ["w"]}',
+        "data: after",
+        'data: {"done": true}',
+    ]
+
+
+def test_buffered_text_is_flushed_while_upstream_stalls():
+    import time
+
+    def gen():
+        yield "Hel"
+        yield "lo"
+        time.sleep(0.5)
+        yield " world"
+
+    with _app.test_request_context():
+        resp = create_stream_response(stream_generator=gen())
+        start = time.monotonic()
+        arrivals = [(time.monotonic() - start, chunk.decode("utf-8")) for chunk in resp.response]
+
+    text = [(t, frame) for t, frame in arrivals if not frame.startswith("data: {")]
+    assert text[0][1] == "data: Hel\n\n"
+    # Everything received before the stall goes out well before the next delta arrives
+    assert "".join(frame for t, frame in text if t < 0.3) == "data: Hel\n\ndata: lo\n\n"
+    assert text[-1][1] == "data:  world\n\n"
@@ -21,9 +21,25 @@ from utils.think_strip import strip_think_content
         ("<reasoning>r</reasoning>tail", "tail"),
         ("A<think>inner</think>B", "AB"),
         ("```thinking\nx\n```y", "y"),
+        ("a```think```b", "ab"),
+        ("a```thinking  ```b", "ab"),
+        ("<Reasoning>r</REASONING>x<think>t</think>y", "xy"),
+        ("<reasoning>keep <think>t</think> out</reasoning>z", "z"),
     ],
 )
 def test_strip_think_content_table(raw, expected):
     out = strip_think_content(raw)
     assert out == expected
 
+
+@pytest.mark.parametrize(
+    "raw,expected",
+    [
+        ("  plain reply  ", "plain reply"),
+        ("A\n\n\n\nB", "A\n\nB"),
+        ("A\n \n \nB", "A\n\nB"),
+        ("Hi <THINK>x</THINK> there", "Hi  there"),
+    ],
+)
+def test_strip_think_content_without_markers_still_normalizes(raw, expected):
+    assert strip_think_content(raw) == expected
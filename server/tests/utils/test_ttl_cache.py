@@ -0,0 +1,36 @@
+"""Tests for the bounded TTL cache."""
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'src'))
+
+from utils.ttl_cache import TTLCache
+
+
+def test_entries_expire_after_ttl():
+    cache = TTLCache(maxsize=4, ttl=10)
+    with patch('utils.ttl_cache.time.monotonic', return_value=100.0):
+        cache.set('k', 'v')
+        assert cache.get('k') == 'v'
+    with patch('utils.ttl_cache.time.monotonic', return_value=110.0):
+        assert cache.get('k') is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+
+
+def test_zero_ttl_disables_cache():
+    cache = TTLCache(maxsize=2, ttl=0)
+    cache.set('a', 1)
+    assert cache.get('a') is None
@@ -0,0 +1,20 @@
+# Copyright © 2016-2025 Patrick Zhang.
+# All Rights Reserved.
+"""
+WSGI entry point for running the API under an external server
+
+The desktop sidecar keeps using run.py (werkzeug make_server, /api/stop support).
+Standalone deployments can serve many concurrent LLM calls with, e.g.:
+
+    gunicorn -k gthread -w 2 --threads 32 -b 127.0.0.1:5000 wsgi:app
+"""
+import sys
+from pathlib import Path
+
+src_dir = Path(__file__).parent / 'src'
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+from app import app  # noqa: E402
+
+__all__ = ['app']